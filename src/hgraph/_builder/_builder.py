@@ -13,6 +13,8 @@ class Builder(ABC, Generic[ITEM]):
     These can be thought of as life-cycle methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def make_instance(self, **kwargs) -> ITEM:
         """
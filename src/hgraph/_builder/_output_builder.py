@@ -12,6 +12,8 @@ __all__ = ('OutputBuilder',)
 
 class OutputBuilder(Builder["TimeSeriesOutput"]):
 
+    __slots__ = ()
+
     def make_instance(self, owning_node: "Node" = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
         """One of owning_node or owning_output must be defined."""
         pass
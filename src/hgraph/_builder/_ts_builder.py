@@ -2,12 +2,11 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional, TYPE_CHECKING
 
-from _pytest.nodes import Node
-
 from hgraph._builder._input_builder import InputBuilder
 from hgraph._builder._output_builder import OutputBuilder
 
 if TYPE_CHECKING:
+    from hgraph._runtime._node import Node
     from hgraph._types._scalar_type_meta_data import HgScalarTypeMetaData
     from hgraph._types._time_series_meta_data import HgTimeSeriesTypeMetaData
     from hgraph._types._time_series_types import TimeSeriesInput, TimeSeriesOutput
@@ -18,7 +17,7 @@ __all__ = ("TSOutputBuilder", "TSInputBuilder", "TimeSeriesBuilderFactory", "TSS
            "TSSignalInputBuilder", "TSDOutputBuilder", "TSDInputBuilder")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TSOutputBuilder(OutputBuilder):
 
     value_tp: "HgScalarTypeMetaData"
@@ -30,12 +29,12 @@ class TSOutputBuilder(OutputBuilder):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TSInputBuilder(InputBuilder):
 
     value_tp: "HgScalarTypeMetaData"
 
-    def make_instance(self, owning_node: Node = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
+    def make_instance(self, owning_node: "Node" = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
         ...
 
     def release_instance(self, item: "TimeSeriesInput"):
@@ -44,57 +43,59 @@ class TSInputBuilder(InputBuilder):
 
 class TSSignalInputBuilder(InputBuilder):
 
-    def make_instance(self, owning_node: Node = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
+    __slots__ = ()
+
+    def make_instance(self, owning_node: "Node" = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
         ...
 
     def release_instance(self, item: "TimeSeriesInput"):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TSBInputBuilder(InputBuilder):
 
     schema: "TimeSeriesSchema"
 
-    def make_instance(self, owning_node: Node = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
+    def make_instance(self, owning_node: "Node" = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
         ...
 
     def release_instance(self, item: "TimeSeriesInput"):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TSBOutputBuilder(OutputBuilder):
 
     schema: "TimeSeriesSchema"
 
-    def make_instance(self, owning_node: Node = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
+    def make_instance(self, owning_node: "Node" = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
         ...
 
     def release_instance(self, item: "TimeSeriesOutput"):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TSLInputBuilder(InputBuilder):
 
     value_tp: "HgTimeSeriesTypeMetaData"
     size_tp: "HgScalarTypeMetaData"
 
-    def make_instance(self, owning_node: Node = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
+    def make_instance(self, owning_node: "Node" = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
         ...
 
     def release_instance(self, item: "TimeSeriesInput"):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TSLOutputBuilder(OutputBuilder):
 
     value_tp: "HgTimeSeriesTypeMetaData"
     size_tp: "HgScalarTypeMetaData"
 
-    def make_instance(self, owning_node: Node = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
+    def make_instance(self, owning_node: "Node" = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
         ...
 
     def release_instance(self, item: "TimeSeriesOutput"):
@@ -103,47 +104,49 @@ class TSLOutputBuilder(OutputBuilder):
 
 class TSDInputBuilder(InputBuilder):
 
+    __slots__ = ()
+
     key_tp: "HgScalarTypeMetaData"
     value_tp: "HgTimeSeriesTypeMetaData"
 
-    def make_instance(self, owning_node: Node = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
+    def make_instance(self, owning_node: "Node" = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
         ...
 
     def release_instance(self, item: "TimeSeriesInput"):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TSDOutputBuilder(OutputBuilder):
 
     key_tp: "HgScalarTypeMetaData"
     value_tp: "HgTimeSeriesTypeMetaData"
 
-    def make_instance(self, owning_node: Node = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
+    def make_instance(self, owning_node: "Node" = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
         ...
 
     def release_instance(self, item: "TimeSeriesOutput"):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TSSOutputBuilder(OutputBuilder):
 
     value_tp: "HgScalarTypeMetaData"
 
-    def make_instance(self, owning_node: Node = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
+    def make_instance(self, owning_node: "Node" = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
         ...
 
     def release_instance(self, item: "TimeSeriesOutput"):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TSSInputBuilder(InputBuilder):
 
     value_tp: "HgScalarTypeMetaData"
 
-    def make_instance(self, owning_node: Node = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
+    def make_instance(self, owning_node: "Node" = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
         ...
 
     def release_instance(self, item: "TimeSeriesInput"):
@@ -151,20 +154,22 @@ class TSSInputBuilder(InputBuilder):
 
 
 class REFInputBuilder(InputBuilder):
+
+    __slots__ = ()
     value_tp: "HgTimeSeriesTypeMetaData"
 
-    def make_instance(self, owning_node: Node = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
+    def make_instance(self, owning_node: "Node" = None, owning_input: "TimeSeriesInput" = None) -> "TimeSeriesInput":
         ...
 
     def release_instance(self, item: "TimeSeriesInput"):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class REFOutputBuilder(OutputBuilder):
     value_tp: "HgTimeSeriesTypeMetaData"
 
-    def make_instance(self, owning_node: Node = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
+    def make_instance(self, owning_node: "Node" = None, owning_output: "TimeSeriesOutput" = None) -> "TimeSeriesOutput":
         ...
 
     def release_instance(self, item: "TimeSeriesOutput"):
@@ -186,9 +191,9 @@ class TimeSeriesBuilderFactory:
 
     @staticmethod
     def instance() -> "TimeSeriesBuilderFactory":
-        if TimeSeriesBuilderFactory._instance is None:
+        if (instance := TimeSeriesBuilderFactory._instance) is None:
             raise RuntimeError("No time-series builder factory has been declared")
-        return TimeSeriesBuilderFactory._instance
+        return instance
 
     @staticmethod
     def declare(factory: "TimeSeriesBuilderFactory"):
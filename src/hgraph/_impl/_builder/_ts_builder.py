@@ -25,6 +25,8 @@ __all__ = ('PythonTSOutputBuilder', 'PythonTSInputBuilder', 'PythonTimeSeriesBui
 
 class PythonTSOutputBuilder(TSOutputBuilder):
 
+    __slots__ = ()
+
     def make_instance(self, owning_node: Node = None, owning_output: TimeSeriesOutput = None):
         from hgraph import PythonTimeSeriesValueOutput
         return PythonTimeSeriesValueOutput(_owning_node=owning_node, _parent_output=owning_output,
@@ -36,6 +38,8 @@ class PythonTSOutputBuilder(TSOutputBuilder):
 
 class PythonTSInputBuilder(TSInputBuilder):
 
+    __slots__ = ()
+
     def make_instance(self, owning_node=None, owning_input=None):
         from hgraph import PythonTimeSeriesValueInput
         return PythonTimeSeriesValueInput(_owning_node=owning_node, _parent_input=owning_input)
@@ -46,6 +50,8 @@ class PythonTSInputBuilder(TSInputBuilder):
 
 class PythonSignalInputBuilder(TSSignalInputBuilder):
 
+    __slots__ = ()
+
     def make_instance(self, owning_node=None, owning_input=None):
         from hgraph import PythonTimeSeriesSignal
         return PythonTimeSeriesSignal(_owning_node=owning_node, _parent_input=owning_input)
@@ -54,7 +60,7 @@ class PythonSignalInputBuilder(TSSignalInputBuilder):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonTSBOutputBuilder(TSBOutputBuilder):
     schema_builders: Mapping[str, TSOutputBuilder] = None
 
@@ -75,7 +81,7 @@ class PythonTSBOutputBuilder(TSBOutputBuilder):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonTSBInputBuilder(TSBInputBuilder):
     schema_builders: Mapping[str, TSInputBuilder] = None
 
@@ -95,7 +101,7 @@ class PythonTSBInputBuilder(TSBInputBuilder):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonTSLOutputBuilder(TSLOutputBuilder):
     value_tp: HgTimeSeriesTypeMetaData
     size_tp: HgScalarTypeMetaData
@@ -122,7 +128,7 @@ class PythonTSLOutputBuilder(TSLOutputBuilder):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonTSLInputBuilder(TSLInputBuilder):
     value_tp: HgTimeSeriesTypeMetaData
     size_tp: HgScalarTypeMetaData
@@ -148,7 +154,7 @@ class PythonTSLInputBuilder(TSLInputBuilder):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonTSDOutputBuilder(TSDOutputBuilder):
     key_tp: "HgScalarTypeMetaData"
     value_tp: "HgTimeSeriesTypeMetaData"
@@ -175,7 +181,7 @@ class PythonTSDOutputBuilder(TSDOutputBuilder):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonTSDInputBuilder(TSDInputBuilder):
     key_tp: "HgScalarTypeMetaData"
     value_tp: "HgTimeSeriesTypeMetaData"
@@ -202,7 +208,7 @@ class PythonTSDInputBuilder(TSDInputBuilder):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonTSSOutputBuilder(TSSOutputBuilder):
 
     def make_instance(self, owning_node: Node = None, owning_output: TimeSeriesOutput = None) -> TimeSeriesOutput:
@@ -214,7 +220,7 @@ class PythonTSSOutputBuilder(TSSOutputBuilder):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonTSSInputBuilder(TSSInputBuilder):
 
     def make_instance(self, owning_node: Node = None, owning_input: TimeSeriesInput = None) -> TimeSeriesInput:
@@ -222,10 +228,10 @@ class PythonTSSInputBuilder(TSSInputBuilder):
         return PythonTimeSeriesSetInput(_owning_node=owning_node, _parent_input=owning_input)
 
     def release_instance(self, item: TimeSeriesInput):
-        super().release_instance(item)
+        TSSInputBuilder.release_instance(self, item)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonREFOutputBuilder(REFOutputBuilder):
     value_tp: "HgTimeSeriesTypeMetaData"
 
@@ -242,7 +248,7 @@ class PythonREFOutputBuilder(REFOutputBuilder):
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonREFInputBuilder(REFInputBuilder):
     value_tp: "HgTimeSeriesTypeMetaData"
     value_builder: TSOutputBuilder = None
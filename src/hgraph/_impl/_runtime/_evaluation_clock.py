@@ -1,4 +1,3 @@
-import sys
 from abc import ABC
 from datetime import datetime, timedelta
 from threading import Condition
@@ -14,6 +13,7 @@ class BaseEvaluationClock(EngineEvaluationClock, ABC):
 
     def __init__(self, start_time: datetime):
         self._evaluation_time = start_time
+        self._next_cycle_evaluation_time: datetime = start_time + MIN_TD
         self._next_scheduled_evaluation_time: datetime = MAX_DT
 
     @property
@@ -23,11 +23,12 @@ class BaseEvaluationClock(EngineEvaluationClock, ABC):
     @evaluation_time.setter
     def evaluation_time(self, value: datetime):
         self._evaluation_time = value
+        self._next_cycle_evaluation_time = value + MIN_TD
         self._next_scheduled_evaluation_time: datetime = MAX_DT
 
     @property
     def next_cycle_evaluation_time(self) -> datetime:
-        return self._evaluation_time + MIN_TD
+        return self._next_cycle_evaluation_time
 
     @property
     def next_scheduled_evaluation_time(self) -> datetime:
@@ -36,8 +37,10 @@ class BaseEvaluationClock(EngineEvaluationClock, ABC):
     def update_next_scheduled_evaluation_time(self, scheudled_time: datetime):
         if scheudled_time == self._evaluation_time:
             return  # This will be evaluated in the current cycle, nothing to do.
-        self._next_scheduled_evaluation_time = max(self.next_cycle_evaluation_time,
-                                                   min(self._next_scheduled_evaluation_time, scheudled_time))
+        # The next scheduled time is never earlier than the next cycle, so only an earlier request can change it
+        if scheudled_time < self._next_scheduled_evaluation_time:
+            next_cycle = self._next_cycle_evaluation_time
+            self._next_scheduled_evaluation_time = scheudled_time if scheudled_time > next_cycle else next_cycle
 
 
 class SimulationEvaluationClock(BaseEvaluationClock):
@@ -57,6 +60,7 @@ class SimulationEvaluationClock(BaseEvaluationClock):
     @evaluation_time.setter
     def evaluation_time(self, value: datetime):
         self._evaluation_time = value
+        self._next_cycle_evaluation_time = value + MIN_TD
         self._system_clock_at_start_of_evaluation = datetime.utcnow()
         self._next_scheduled_evaluation_time = MAX_DT
 
@@ -84,8 +88,8 @@ class SimulationEvaluationClock(BaseEvaluationClock):
     def push_node_requires_scheduling(self) -> bool:
         return False
 
-    def reset_push_node_requires_scheduling(self):
-        raise NotImplementedError()
+    def reset_push_node_requires_scheduling(self) -> bool:
+        return False
 
 
 class RealTimeEvaluationClock(BaseEvaluationClock):
@@ -116,25 +120,24 @@ class RealTimeEvaluationClock(BaseEvaluationClock):
             self._push_node_requires_scheduling = True
             self._push_node_requires_scheduling_condition.notify_all()
 
+    @property
     def push_node_requires_scheduling(self) -> bool:
         with self._push_node_requires_scheduling_condition:
             return self._push_node_requires_scheduling
 
     def advance_to_next_scheduled_time(self):
         next_scheduled_time = self.next_scheduled_evaluation_time
-        print(f"RealTimeEvaluationClock.advance_to_next_scheduled_time: {next_scheduled_time}", file=sys.stderr)
         with self._push_node_requires_scheduling_condition:
-            while datetime.utcnow() < next_scheduled_time and not self._push_node_requires_scheduling:
-                sleep_time = (next_scheduled_time - datetime.utcnow()).total_seconds()
-                print(f"RealTimeEvaluationClock.advance_to_next_scheduled_time: sleeping for {sleep_time}", file=sys.stderr)
-                self._push_node_requires_scheduling_condition.wait(sleep_time)
+            # Sample the system clock once per wake-up
+            while (now := datetime.utcnow()) < next_scheduled_time and not self._push_node_requires_scheduling:
+                self._push_node_requires_scheduling_condition.wait((next_scheduled_time - now).total_seconds())
             # It could be that a push node has triggered
-        print(f"RealTimeEvaluationClock.advance_to_next_scheduled_time: setting evaluation time to {next_scheduled_time}", file=sys.stderr)
         self.evaluation_time = min(next_scheduled_time, datetime.utcnow())
 
-    def reset_push_node_requires_scheduling(self):
+    def reset_push_node_requires_scheduling(self) -> bool:
         """
-        Reset the push_has_pending_values property.
+        Reset the push_has_pending_values property, returning the value it held prior to the reset.
         """
         with self._push_node_requires_scheduling_condition:
-            self._push_node_requires_scheduling = False
+            requires_scheduling, self._push_node_requires_scheduling = self._push_node_requires_scheduling, False
+            return requires_scheduling
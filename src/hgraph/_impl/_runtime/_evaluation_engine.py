@@ -1,3 +1,4 @@
+from collections import deque
 from datetime import datetime
 from typing import List
 
@@ -5,6 +6,8 @@ from hgraph._runtime._constants import MIN_TD
 from hgraph._runtime._evaluation_clock import EvaluationClock, EngineEvaluationClock
 from hgraph._runtime._evaluation_engine import EvaluationEngine, EvaluationEngineApi, EvaluationLifeCycleObserver
 
+_LIFE_CYCLE_EVENTS = tuple(k for k in EvaluationLifeCycleObserver.__dict__ if k.startswith("on_"))
+
 
 class PythonEvaluationEngine(EvaluationEngine):
 
@@ -15,7 +18,10 @@ class PythonEvaluationEngine(EvaluationEngine):
         self._end_time: datetime = end_time
         self._stop_requested: bool = False
         self._life_cycle_observers: List[EvaluationLifeCycleObserver] = []
-        self._before_evaluation_notification: List[callable] = []
+        self._has_life_cycle_observers: bool = False
+        # The bound observer call-backs for each life-cycle event, saves resolving the method on each notification
+        self._life_cycle_dispatch: dict[str, List[callable]] = {event: [] for event in _LIFE_CYCLE_EVENTS}
+        self._before_evaluation_notification: deque[callable] = deque()
         self._after_evaluation_notification: List[callable] = []
 
     @property
@@ -26,6 +32,10 @@ class PythonEvaluationEngine(EvaluationEngine):
     def engine_evaluation_clock(self) -> "EngineEvaluationClock":
         return self._engine_evaluation_clock
 
+    @property
+    def has_life_cycle_observers(self) -> bool:
+        return self._has_life_cycle_observers
+
     @property
     def start_time(self) -> datetime:
         return self._start_time
@@ -49,9 +59,15 @@ class PythonEvaluationEngine(EvaluationEngine):
 
     def add_life_cycle_observer(self, observer: EvaluationLifeCycleObserver):
         self._life_cycle_observers.append(observer)
+        self._has_life_cycle_observers = True
+        for event, call_backs in self._life_cycle_dispatch.items():
+            call_backs.append(getattr(observer, event))
 
     def remove_life_cycle_observer(self, observer: EvaluationLifeCycleObserver):
         self._life_cycle_observers.remove(observer)
+        self._has_life_cycle_observers = bool(self._life_cycle_observers)
+        self._life_cycle_dispatch = {event: [getattr(observer_, event) for observer_ in self._life_cycle_observers]
+                                     for event in _LIFE_CYCLE_EVENTS}
 
     def advance_engine_time(self):
         if self._stop_requested:
@@ -63,60 +79,62 @@ class PythonEvaluationEngine(EvaluationEngine):
         self._engine_evaluation_clock.advance_to_next_scheduled_time()
 
     def notify_before_evaluation(self):
-        for notification_receiver in self._before_evaluation_notification:
-            notification_receiver()
-        self._before_evaluation_notification.clear()
+        # Drain in place, before notifications are delivered in the order they were added
+        notifications = self._before_evaluation_notification
+        while notifications:
+            notifications.popleft()()
 
     def notify_after_evaluation(self):
-        for notification_receiver in reversed(self._after_evaluation_notification):
-            notification_receiver()
-        self._after_evaluation_notification.clear()
+        # Drain in place, after notifications are delivered in the reverse order they were added
+        notifications = self._after_evaluation_notification
+        while notifications:
+            notifications.pop()()
 
     def notify_before_graph_evaluation(self, graph):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_before_graph_evaluation(graph)
+        for call_back in self._life_cycle_dispatch["on_before_graph_evaluation"]:
+            call_back(graph)
 
     def notify_after_graph_evaluation(self, graph):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_after_graph_evaluation(graph)
+        for call_back in self._life_cycle_dispatch["on_after_graph_evaluation"]:
+            call_back(graph)
 
     def notify_before_node_evaluation(self, node):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_before_node_evaluation(node)
+        for call_back in self._life_cycle_dispatch["on_before_node_evaluation"]:
+            call_back(node)
 
     def notify_after_node_evaluation(self, node):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_after_node_evaluation(node)
+        for call_back in self._life_cycle_dispatch["on_after_node_evaluation"]:
+            call_back(node)
 
     def notify_before_start_graph(self, graph):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_before_start_graph(graph)
+        for call_back in self._life_cycle_dispatch["on_before_start_graph"]:
+            call_back(graph)
 
     def notify_after_start_graph(self, graph):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_after_start_graph(graph)
+        for call_back in self._life_cycle_dispatch["on_after_start_graph"]:
+            call_back(graph)
 
     def notify_before_stop_graph(self, graph):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_before_stop_graph(graph)
+        for call_back in self._life_cycle_dispatch["on_before_stop_graph"]:
+            call_back(graph)
 
     def notify_after_stop_graph(self, graph):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_after_stop_graph(graph)
+        for call_back in self._life_cycle_dispatch["on_after_stop_graph"]:
+            call_back(graph)
 
     def notify_before_start_node(self, node):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_before_start_node(node)
+        for call_back in self._life_cycle_dispatch["on_before_start_node"]:
+            call_back(node)
 
     def notify_after_start_node(self, node):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_after_start_node(node)
+        for call_back in self._life_cycle_dispatch["on_after_start_node"]:
+            call_back(node)
 
     def notify_before_stop_node(self, node):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_before_stop_node(node)
+        for call_back in self._life_cycle_dispatch["on_before_stop_node"]:
+            call_back(node)
 
     def notify_after_stop_node(self, node):
-        for life_cycle_observer in self._life_cycle_observers:
-            life_cycle_observer.on_after_stop_node(node)
+        for call_back in self._life_cycle_dispatch["on_after_stop_node"]:
+            call_back(node)
 
@@ -1,5 +1,6 @@
 import functools
 from datetime import datetime
+from heapq import heappush, heappop
 
 from hgraph._runtime._constants import MIN_DT
 from hgraph._runtime._evaluation_clock import EvaluationClock
@@ -21,6 +22,9 @@ class PythonGraph(Graph):
         self._graph_id: tuple[int, ...] = graph_id
         self._nodes: tuple[Node, ...] | list[Node] = nodes  # No absolute requirement for this to be a tuple.
         self._schedule: list[datetime, ...] = [MIN_DT] * len(nodes)
+        # Min-heap of (scheduled_time, node_ndx), entries are lazily removed when they no longer match the schedule
+        self._schedule_heap: list[tuple[datetime, int]] = []
+        self._push_source_nodes: tuple[Node, ...] | list[Node] = ()  # Set up in initialise
         self._evaluation_engine: EvaluationEngine = None
         self._parent_node: Node = parent_node
 
@@ -71,6 +75,7 @@ class PythonGraph(Graph):
         return len(self.nodes)  # In the very unlikely event that there are only push source nodes.
 
     def initialise(self):
+        self._push_source_nodes = self._nodes[:self.push_source_nodes_end]
         for node in self.nodes:
             node.graph = self
         for node in self.nodes:
@@ -82,14 +87,22 @@ class PythonGraph(Graph):
             raise RuntimeError(
                 f"Graph[{self.graph_id}] Trying to schedule node: {self.nodes[node_ndx].signature.signature}[{node_ndx}]"
                 f" for {time} but current time is {self.evaluation_clock.evaluation_time}")
-        self.schedule[node_ndx] = time
+        if self._schedule[node_ndx] != time:
+            # A node is often notified by several inputs in the same cycle, only track the first request in the heap
+            self._schedule[node_ndx] = time
+            heappush(self._schedule_heap, (time, node_ndx))
         clock.update_next_scheduled_evaluation_time(time)
 
     @start_guard
     def start(self):
         engine = self._evaluation_engine
+        nodes = self._nodes
+        if not engine.has_life_cycle_observers:
+            for node in nodes:
+                node.start()
+            return
         engine.notify_before_start_graph(self)
-        for node in self._nodes:
+        for node in nodes:
             engine.notify_before_start_node(node)
             node.start()
             engine.notify_after_start_node(node)
@@ -98,11 +111,16 @@ class PythonGraph(Graph):
     @stop_guard
     def stop(self):
         engine = self._evaluation_engine
+        nodes = self._nodes
+        if not engine.has_life_cycle_observers:
+            for node in nodes:
+                node.stop()
+            return
         engine.notify_before_stop_graph(self)
-        for node in self._nodes:
+        for node in nodes:
             engine.notify_before_stop_node(node)
             node.stop()
-            engine.notify_before_start_node(node)
+            engine.notify_after_stop_node(node)
         engine.notify_after_stop_graph(self)
 
     def dispose(self):
@@ -110,25 +128,44 @@ class PythonGraph(Graph):
             node.dispose()
 
     def evaluate_graph(self):
-        self._evaluation_engine.notify_before_graph_evaluation(self)
+        engine = self._evaluation_engine
+        # Life-cycle observers are rare, so avoid the notification overhead per node when there are none.
+        if observed := engine.has_life_cycle_observers:
+            engine.notify_before_graph_evaluation(self)
 
-        now = (clock := self._evaluation_engine.engine_evaluation_clock).evaluation_time
+        now = (clock := engine.engine_evaluation_clock).evaluation_time
         nodes = self._nodes
         schedule = self._schedule
-
-        if clock.push_node_requires_scheduling:
-            clock.reset_push_node_requires_scheduling()
-            for i in range(self.push_source_nodes_end):
-                nodes[i].eval()  # This is only to move nodes on, won't call the before and after node eval here
-
-        for i in range(self.push_source_nodes_end, len(nodes)):
-            scheduled_time, node = schedule[i], nodes[i]
-            if scheduled_time == now:
-                self._evaluation_engine.notify_before_node_evaluation(node)
+        heap = self._schedule_heap
+        push_source_nodes_end = self.push_source_nodes_end
+
+        # The push source nodes are fixed once initialised, graphs without any need not consult the clock.
+        # Test and clear the pending flag in one step.
+        if (push_source_nodes := self._push_source_nodes) and clock.reset_push_node_requires_scheduling():
+            for node in push_source_nodes:
+                node.eval()  # This is only to move nodes on, won't call the before and after node eval here
+
+        # Only visit the nodes that are scheduled, in node order. Stale entries (where the node has since been
+        # re-scheduled) are discarded as they are encountered, as are nodes that have already been visited this cycle.
+        last_ndx = push_source_nodes_end - 1
+        while heap and heap[0][0] <= now:
+            scheduled_time, i = heappop(heap)
+            if i <= last_ndx or scheduled_time != now or schedule[i] != now:
+                continue
+            last_ndx = i
+            if observed:
+                node = nodes[i]
+                engine.notify_before_node_evaluation(node)
                 node.eval()
-                self._evaluation_engine.notify_after_node_evaluation(node)
-            elif scheduled_time > now:
-                # If the node has a scheduled time in the future, we need to let the execution context know.
-                clock.update_next_scheduled_evaluation_time(scheduled_time)
-
-        self._evaluation_engine.notify_after_graph_evaluation(self)
+                engine.notify_after_node_evaluation(node)
+            else:
+                nodes[i].eval()
+
+        while heap and schedule[(next_ := heap[0])[1]] != next_[0]:
+            heappop(heap)
+        if heap:
+            # If a node has a scheduled time in the future, we need to let the execution context know.
+            clock.update_next_scheduled_evaluation_time(heap[0][0])
+
+        if observed:
+            engine.notify_after_graph_evaluation(self)
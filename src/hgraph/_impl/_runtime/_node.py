@@ -3,9 +3,11 @@ import threading
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from heapq import heappop, heappush
+from inspect import signature
 from typing import Optional, Mapping, TYPE_CHECKING, Callable, Any, Iterator
 
-from sortedcontainers import SortedList
+from frozendict import frozendict
 
 from hgraph._runtime._evaluation_clock import EngineEvaluationClock
 from hgraph._runtime._constants import MIN_DT, MAX_DT, MIN_ST
@@ -20,11 +22,20 @@ if TYPE_CHECKING:
 __all__ = ("NodeImpl",)
 
 
+@functools.lru_cache(maxsize=None)
+def _fn_param_names(fn: Callable) -> tuple[str, ...]:
+    """The parameter names of the start / stop functions, these are shared by every node instance of the function"""
+    return tuple(signature(fn).parameters)
+
+
 class NodeImpl(Node):
     """
     Provide a basic implementation of the Node as a reference implementation.
     """
 
+    __slots__ = ("_node_ndx", "_owning_graph_id", "_node_id", "_signature", "_scalars", "_graph", "eval_fn", "start_fn",
+                 "stop_fn", "_input", "_output", "_scheduler", "_kwargs", "_valid_inputs", "_valid_input_ts", "_inputs")
+
     def __init__(self,
                  node_ndx: int,
                  owning_graph_id:
@@ -38,6 +49,7 @@ class NodeImpl(Node):
         super().__init__()
         self._node_ndx: int = node_ndx
         self._owning_graph_id: tuple[int, ...] = owning_graph_id
+        self._node_id: tuple[int, ...] = owning_graph_id + (node_ndx,)
         self._signature: NodeSignature = signature
         self._scalars: Mapping[str, Any] = scalars
         self._graph: Graph = None
@@ -45,9 +57,14 @@ class NodeImpl(Node):
         self.start_fn: Callable = start_fn
         self.stop_fn: Callable = stop_fn
         self._input: Optional["TimeSeriesBundleInput"] = None
+        self._inputs: Optional[Mapping[str, "TimeSeriesInput"]] = None
+        self._valid_input_ts: Optional[tuple["TimeSeriesInput", ...]] = None
         self._output: Optional["TimeSeriesOutput"] = None
-        self._scheduler: Optional["NodeSchedulerImpl"] = None
+        self._scheduler: NodeScheduler = _NULL_SCHEDULER  # Replaced with a real scheduler on first use
         self._kwargs: dict[str, Any] = None
+        # The inputs that must be valid for the node to evaluate, this is fixed for the life of the node
+        self._valid_inputs: tuple[str, ...] = tuple(signature.time_series_inputs or ()) \
+            if signature.valid_inputs is None else tuple(signature.valid_inputs)
 
     @property
     def node_ndx(self) -> int:
@@ -65,10 +82,10 @@ class NodeImpl(Node):
     def scalars(self) -> Mapping[str, Any]:
         return self._scalars
 
-    @functools.cached_property
+    @property
     def node_id(self) -> tuple[int, ...]:
-        """ Computed once and then cached """
-        return self.owning_graph_id + tuple([self.node_ndx])
+        """ Computed once on construction """
+        return self._node_id
 
     @property
     def graph(self) -> "Graph":
@@ -85,6 +102,9 @@ class NodeImpl(Node):
     @input.setter
     def input(self, value: "TimeSeriesBundleInput"):
         self._input = value
+        self._inputs = None
+        # Resolve the inputs to validate when the bundle is bound, rather than looking them up by name on each eval
+        self._valid_input_ts = None if value is None else tuple(value[k] for k in self._valid_inputs)
 
     @property
     def output(self) -> Optional["TimeSeriesOutput"]:
@@ -96,30 +116,34 @@ class NodeImpl(Node):
 
     @property
     def inputs(self) -> Optional[Mapping[str, "TimeSeriesInput"]]:
-        # noinspection PyTypeChecker
-        return {k: self.input[k] for k in self.signature.time_series_inputs}
+        # Built on first use and then cached until the input is replaced
+        if (inputs := self._inputs) is None:
+            # noinspection PyTypeChecker
+            inputs = self._inputs = frozendict({k: self._input[k] for k in self.signature.time_series_inputs})
+        return inputs
 
     @property
     def scheduler(self) -> "NodeScheduler":
-        if self._scheduler is None:
-            self._scheduler = NodeSchedulerImpl(self)
-        return self._scheduler
+        if (scheduler := self._scheduler) is _NULL_SCHEDULER:
+            scheduler = self._scheduler = NodeSchedulerImpl(self)
+        return scheduler
 
     def initialise(self):
         pass
 
     def _initialise_kwargs(self):
         from hgraph._types._scalar_type_meta_data import Injector
-        extras = {}
-        for k, s in self.scalars.items():
-            if isinstance(s, Injector):
-                extras[k] = s(self)
-        try:
-            self._kwargs = {k: v for k, v in {**(self.input or {}), **self.scalars, **extras}.items() if
-                            k in self.signature.args}
-        except:
-            print("Except")
-            raise
+        scalars = self.scalars
+        input_ = self._input
+        input_keys = () if input_ is None else input_.keys()
+        kwargs = {}
+        for k in self.signature.args:
+            if k in scalars:
+                s = scalars[k]
+                kwargs[k] = s(self) if isinstance(s, Injector) else s
+            elif k in input_keys:
+                kwargs[k] = input_[k]
+        self._kwargs = kwargs
 
     def _initialise_inputs(self):
         if self.input:
@@ -129,47 +153,47 @@ class NodeImpl(Node):
                     ts.make_active()
 
     def eval(self):
-        scheduled = False if self._scheduler is None else self._scheduler.is_scheduled_now
-        if self.input:
+        # This is called for every scheduled node on every engine cycle, so attribute access is kept to the minimum
+        scheduler = self._scheduler
+        scheduled = scheduler.is_scheduled_now
+        if (valid_input_ts := self._valid_input_ts) is not None:
             # Perform validity check of inputs
-            args = self.signature.valid_inputs if self.signature.valid_inputs is not None else self.signature.time_series_inputs.keys()
-            if not all(self.input[k].valid for k in args):
-                return  # We should look into caching the result of this check.
-                # This check could perhaps be set on a separate call?
-            if self._scheduler is not None:
-                # It is possible we have scheduled and then remove the schedule,
-                # so we need to check that something has caused this to be scheduled.
-                if not scheduled and not any(self.input[k].valid for k in args):
+            for ts in valid_input_ts:
+                if not ts.valid:
                     return
+            # It is possible we have scheduled and then remove the schedule,
+            # so we need to check that something has caused this to be scheduled.
+            # All the valid inputs are valid at this point, so this only fails when there are none to check.
+            if not valid_input_ts and not scheduled and scheduler is not _NULL_SCHEDULER:
+                return
         out = self.eval_fn(**self._kwargs)
         if out is not None:
-            self.output.apply_result(out)
+            self._output.apply_result(out)
         if scheduled:
-            self._scheduler.advance()
+            scheduler.advance()
 
     @start_guard
     def start(self):
         self._initialise_kwargs()
         self._initialise_inputs()
         if self.start_fn is not None:
-            from inspect import signature
-            self.start_fn(**{k: self._kwargs[k] for k in (signature(self.start_fn).parameters.keys())})
-        if self._scheduler is not None:
-            if self._scheduler.pop_tag("start", None) is not None:
-                self.notify()
-                if not self.signature.uses_scheduler:
-                    self._scheduler = None
-            else:
-                self._scheduler.advance()
+            self.start_fn(**{k: self._kwargs[k] for k in _fn_param_names(self.start_fn)})
+        if self._scheduler.pop_tag("start", None) is not None:
+            self.notify()
+            if not self.signature.uses_scheduler:
+                self._scheduler = _NULL_SCHEDULER
+        else:
+            self._scheduler.advance()
 
     @stop_guard
     def stop(self):
-        from inspect import signature
         if self.stop_fn is not None:
-            self.stop_fn(**{k: self._kwargs[k] for k in (signature(self.stop_fn).parameters.keys())})
+            self.stop_fn(**{k: self._kwargs[k] for k in _fn_param_names(self.stop_fn)})
 
     def dispose(self):
         self._kwargs = None  # For neatness purposes only, not required here.
+        # Drop the scheduler (and its reference back to this node), a disposed node can not be scheduled.
+        self._scheduler = _NULL_SCHEDULER
 
     def notify(self):
         """Notify the graph that this node needs to be evaluated."""
@@ -181,56 +205,71 @@ class NodeImpl(Node):
 
 class NodeSchedulerImpl(NodeScheduler):
 
+    __slots__ = ("_node", "_scheduled_events", "_tags")
+
     def __init__(self, node: NodeImpl):
         self._node = node
-        self._scheduled_events: SortedList[tuple[datetime, str]] = SortedList[tuple[datetime, str]]()
+        # A min-heap of (when, tag) events, untagged events use the tag "". The tags dictionary is the source of truth
+        # for tagged events, entries that have been re-scheduled or removed are left on the heap and are discarded when
+        # they reach the top.
+        self._scheduled_events: list[tuple[datetime, str]] = []
         self._tags: dict[str, datetime] = {}
 
+    def _peek(self) -> tuple[datetime, str] | None:
+        """The earliest live event, discarding any stale entries found on the way"""
+        events = self._scheduled_events
+        tags = self._tags
+        while events:
+            when, tag = event = events[0]
+            if not tag or tags.get(tag) == when:
+                return event
+            heappop(events)
+        return None
+
     @property
     def next_scheduled_time(self) -> datetime:
-        return self._scheduled_events[0][0] if self._scheduled_events else MIN_DT
+        return event[0] if (event := self._peek()) is not None else MIN_DT
 
     @property
     def is_scheduled(self) -> bool:
-        return bool(self._scheduled_events)
+        return self._peek() is not None
 
     @property
     def is_scheduled_now(self) -> bool:
-        return self._scheduled_events and self._scheduled_events[0][
-            0] == self._node.graph.evaluation_clock.evaluation_time
+        return (event := self._peek()) is not None and \
+            event[0] == self._node.graph.evaluation_clock.evaluation_time
 
     def has_tag(self, tag: str) -> bool:
         return tag in self._tags
 
     def pop_tag(self, tag: str, default=None) -> datetime:
-        if tag in self._tags:
-            dt = self._tags.pop(tag)
-            self._scheduled_events.remove((dt, tag))
-            return dt
-        else:
-            return default
+        return self._tags.pop(tag, default)
 
     def schedule(self, when: datetime | timedelta, tag: str = None):
+        node = self._node
         if tag is not None:
-            if tag in self._tags:
-                self._scheduled_events.remove((self._tags[tag], tag))
-        if type(when) is timedelta:
-            when = self._node.graph.evaluation_clock.evaluation_time + when
-        if when > (
-                self._node.graph.evaluation_clock.evaluation_time if (is_stated := self._node.is_started) else MIN_DT):
-            self._tags[tag] = when
-            current_first = self._scheduled_events[0][0] if self._scheduled_events else MAX_DT
-            self._scheduled_events.add((when, "" if tag is None else tag))
-            if is_stated and current_first > (next := self.next_scheduled_time):
-                self._node.graph.schedule_node(self._node.node_ndx, next)
+            self._tags.pop(tag, None)
+        is_delta = type(when) is timedelta
+        if (is_started := node.is_started) or is_delta:
+            # The clock is only consulted when it is needed, prior to start this may not yet be available
+            evaluation_time = node.graph.evaluation_clock.evaluation_time
+            if is_delta:
+                when = evaluation_time + when
+        if when > (evaluation_time if is_started else MIN_DT):
+            current_first = event[0] if (event := self._peek()) is not None else MAX_DT
+            if tag is not None:
+                self._tags[tag] = when
+            heappush(self._scheduled_events, (when, "" if tag is None else tag))
+            if is_started and current_first > when:
+                node.graph.schedule_node(node.node_ndx, when)
 
     def un_schedule(self, tag: str = None):
         if tag is not None:
-            if tag in self._tags:
-                self._scheduled_events.remove((self._tags[tag], tag))
-                del self._tags[tag]
-        elif self._scheduled_events:
-            self._scheduled_events.pop(0)
+            self._tags.pop(tag, None)
+        elif (event := self._peek()) is not None:
+            heappop(self._scheduled_events)
+            if event[1]:
+                del self._tags[event[1]]
 
     def reset(self):
         self._scheduled_events.clear()
@@ -238,14 +277,60 @@ class NodeSchedulerImpl(NodeScheduler):
 
     def advance(self):
         until = self._node.graph.evaluation_clock.evaluation_time
-        while self._scheduled_events and self._scheduled_events[0][0] <= until:
-            self._scheduled_events.pop(0)
-        if self._scheduled_events:
-            self._node.graph.schedule_node(self._node.node_ndx, self._scheduled_events[0][0])
+        while (event := self._peek()) is not None and event[0] <= until:
+            heappop(self._scheduled_events)
+            if event[1]:
+                del self._tags[event[1]]
+        if event is not None:
+            self._node.graph.schedule_node(self._node.node_ndx, event[0])
+
+
+class _NullScheduler(NodeScheduler):
+    """
+    The scheduler of nodes that have not requested one, this has no events, so the per-cycle checks in the node need
+    not test for the presence of a scheduler.
+    """
+
+    __slots__ = ()
+
+    @property
+    def next_scheduled_time(self) -> datetime:
+        return MIN_DT
+
+    @property
+    def is_scheduled(self) -> bool:
+        return False
+
+    @property
+    def is_scheduled_now(self) -> bool:
+        return False
+
+    def has_tag(self, tag: str) -> bool:
+        return False
+
+    def pop_tag(self, tag: str, default=None) -> datetime:
+        return default
+
+    def schedule(self, when: datetime | timedelta, tag: str = None):
+        raise RuntimeError("The null scheduler cannot schedule events")
+
+    def un_schedule(self, tag: str = None):
+        pass
+
+    def reset(self):
+        pass
+
+    def advance(self):
+        pass
+
+
+_NULL_SCHEDULER = _NullScheduler()
 
 
 class GeneratorNodeImpl(NodeImpl):
 
+    __slots__ = ("generator", "next_value")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.generator: Iterator = None
@@ -258,13 +343,15 @@ class GeneratorNodeImpl(NodeImpl):
         self.graph.schedule_node(self.node_ndx, self.graph.evaluation_clock.evaluation_time)
 
     def eval(self):
-        time, out = next(self.generator, (None, None))
-        if out is not None and time is not None and time <= self.graph.evaluation_clock.evaluation_time:
+        generator = self.generator
+        evaluation_time = self.graph.evaluation_clock.evaluation_time
+        time, out = next(generator, (None, None))
+        while out is not None and time is not None and time <= evaluation_time:
             self.output.apply_result(out)
             self.next_value = None
-            self.eval()  # We are going to apply now! Prepare next step,
-            return
-            # This should ultimately either produce no result or a result that is to be scheduled
+            # We are going to apply now! Prepare next step,
+            # this should ultimately either produce no result or a result that is to be scheduled
+            time, out = next(generator, (None, None))
 
         if self.next_value is not None:
             self.output.apply_result(self.next_value)
@@ -278,6 +365,8 @@ class GeneratorNodeImpl(NodeImpl):
 @dataclass
 class PythonPushQueueNodeImpl(NodeImpl):  # Node
 
+    __slots__ = ("receiver",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.receiver: "_SenderReceiverState" = None
@@ -290,11 +379,14 @@ class PythonPushQueueNodeImpl(NodeImpl):  # Node
         self.eval_fn(self.receiver, **self._kwargs)
 
     def eval(self):
-        value = self.receiver.dequeue()
+        receiver = self.receiver
+        value = receiver.dequeue()
         if value is None:
             return
-        self.graph.engine_evaluation_clock.mark_push_node_requires_scheduling()
-        self.output.apply_result(value)
+        if receiver:
+            # Only request another cycle when there are further values pending, enqueue requests one for new values
+            self.graph.engine_evaluation_clock.mark_push_node_requires_scheduling()
+        self._output.apply_result(value)
 
     @stop_guard
     def stop(self):
@@ -302,7 +394,7 @@ class PythonPushQueueNodeImpl(NodeImpl):  # Node
         self.receiver = None
 
 
-@dataclass
+@dataclass(slots=True)
 class _SenderReceiverState:
     lock: threading.RLock
     queue: deque
@@ -313,6 +405,8 @@ class _SenderReceiverState:
         self.enqueue(value)
 
     def enqueue(self, value):
+        # The lock serialises the senders (holding the receiver blocks other senders across a number of enqueues),
+        # the engine thread only pops from the deque, which is atomic, so it does not take the lock.
         with self.lock:
             if self.stopped:
                 raise RuntimeError("Cannot enqueue into a stopped receiver")
@@ -320,12 +414,13 @@ class _SenderReceiverState:
             self.evaluation_evaluation_clock.mark_push_node_requires_scheduling()
 
     def dequeue(self):
-        with self.lock:
-            return self.queue.popleft() if self.queue else None
+        try:
+            return self.queue.popleft()
+        except IndexError:
+            return None
 
     def __bool__(self):
-        with self.lock:
-            return bool(self.queue)
+        return bool(self.queue)
 
     def __enter__(self):
         self.lock.acquire()
@@ -121,10 +121,12 @@ class PythonTimeSeriesDictOutput(PythonTimeSeriesOutput, TimeSeriesDictOutput[K,
         return self._added_keys
 
     def added_values(self) -> Iterable[V]:
-        return (self[k] for k in self._added_keys)
+        ts_values = self._ts_values
+        return [ts_values[k] for k in self._added_keys]
 
     def added_items(self) -> Iterable[Tuple[K, V]]:
-        return ((k, self[k]) for k in self._added_keys)
+        ts_values = self._ts_values
+        return [(k, ts_values[k]) for k in self._added_keys]
 
     def removed_keys(self) -> Iterable[K]:
         return self._removed_items.keys()
@@ -178,7 +180,11 @@ class PythonTimeSeriesDictInput(PythonBoundTimeSeriesInput, TimeSeriesDictInput[
             self._ts_values = {}
             self.owning_graph.evaluation_engine_api.add_after_evaluation_notification(self._clear_key_changes)
 
-        for key in key_set.values():
+        # There are no values at this point, so create the time-series for all the keys in one go before binding them.
+        keys = key_set.values()
+        ts_builder = self._ts_builder
+        self._ts_values = {key: ts_builder.make_instance(owning_input=self) for key in keys}
+        for key in keys:
             self.on_key_added(key)
 
         output.add_key_observer(self)
@@ -243,10 +249,12 @@ class PythonTimeSeriesDictInput(PythonBoundTimeSeriesInput, TimeSeriesDictInput[
         return self.key_set.added()
 
     def added_values(self) -> Iterable[V]:
-        return (self[k] for k in self.added_keys())
+        ts_values = self._ts_values
+        return [ts_values[k] for k in self.added_keys()]
 
     def added_items(self) -> Iterable[Tuple[K, V]]:
-        return ((k, self[k]) for k in self.added_keys())
+        ts_values = self._ts_values
+        return [(k, ts_values[k]) for k in self.added_keys()]
 
     def removed_keys(self) -> Iterable[K]:
         return self.key_set.removed()
@@ -115,9 +115,10 @@ class EngineEvaluationClock(EvaluationClock):
         """
 
     @abstractmethod
-    def reset_push_node_requires_scheduling(self):
+    def reset_push_node_requires_scheduling(self) -> bool:
         """
-        Reset the push_has_pending_values property.
+        Reset the push_has_pending_values property, returning the value it held prior to the reset.
+        This allows the engine to test and clear the flag in a single step.
         """
 
 
@@ -152,8 +153,8 @@ class EngineEvaluationClockDelegate(EngineEvaluationClock):
     def push_node_requires_scheduling(self) -> bool:
         return self._engine_evaluation_clock.push_node_requires_scheduling
 
-    def reset_push_node_requires_scheduling(self):
-        self._engine_evaluation_clock.reset_push_node_requires_scheduling()
+    def reset_push_node_requires_scheduling(self) -> bool:
+        return self._engine_evaluation_clock.reset_push_node_requires_scheduling()
 
     @property
     def now(self) -> datetime:
@@ -179,6 +179,14 @@ class EvaluationEngine(EvaluationEngineApi, ABC):
         and nested graph engines.
         """
 
+    @property
+    @abstractmethod
+    def has_life_cycle_observers(self) -> bool:
+        """
+        True if any life-cycle observers are registered, this allows the graph to skip the
+        life-cycle notifications when no-one is listening.
+        """
+
     def advance_engine_time(self):
         """
         Advance the engine time, this will deal with stopping the engine
@@ -259,6 +267,10 @@ class EvaluationEngineDelegate(EvaluationEngine):
     def engine_evaluation_clock(self) -> "EngineEvaluationClock":
         return self._engine.engine_evaluation_clock
 
+    @property
+    def has_life_cycle_observers(self) -> bool:
+        return self._engine.has_life_cycle_observers
+
     @property
     def start_time(self) -> datetime:
         return self._engine.start_time
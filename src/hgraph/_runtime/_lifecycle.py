@@ -25,6 +25,8 @@ class ComponentLifeCycle:
           full clean-up is called only on dispose.
     """
 
+    __slots__ = ("_started", "_transitioning")
+
     def __init__(self):
         self._started : bool= False
         self._transitioning: bool = False
@@ -50,6 +50,7 @@ class NodeSignature:
 
 
 class Node(ComponentLifeCycle, ABC):
+    __slots__ = ()
 
     @property
     @abstractmethod
@@ -167,6 +168,8 @@ class NodeScheduler(ABC):
     inputs that are not bound to an output, but are still required to be evaluated at a particular time.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def next_scheduled_time(self) -> datetime:
@@ -4,8 +4,8 @@ from typing import Callable, Optional, cast, Mapping, TYPE_CHECKING
 from frozendict import frozendict
 
 from hgraph._wiring._source_code_details import SourceCodeDetails
-from hgraph._types._time_series_meta_data import HgTimeSeriesTypeMetaData
 from hgraph._types._type_meta_data import HgTypeMetaData
+from hgraph._types._ref_meta_data import HgREFTypeMetaData
 from hgraph._wiring._wiring_utils import stub_wiring_port, as_reference
 from hgraph._wiring._wiring_node_signature import WiringNodeSignature, WiringNodeType
 from hgraph._wiring._wiring import WiringNodeClass, extract_kwargs, WiringPort
@@ -22,6 +22,9 @@ if TYPE_CHECKING:
 __all__ = ("switch_",)
 
 
+_EMPTY_FROZENDICT = frozendict()
+
+
 def switch_(switches: dict[SCALAR, Callable[[...], Optional[TIME_SERIES_TYPE]]], key: TS[SCALAR], *args,
             reload_on_ticked: bool = False, **kwargs) -> Optional[TIME_SERIES_TYPE]:
     """
@@ -71,64 +74,104 @@ def switch_(switches: dict[SCALAR, Callable[[...], Optional[TIME_SERIES_TYPE]]],
         input_has_key_arg = a_signature.args[0] == 'key' and \
                             a_signature.input_types['key'] == cast(WiringPort, key).output_type
 
-        # We add the key to the inputs if the internal component has a key argument.
-        kwargs_ = extract_kwargs(a_signature, *args,
-                                 _args_offset=1 if input_has_key_arg else 0, key=key,
-                                 **(kwargs | dict(key=key) if input_has_key_arg else {}))
+        # The key is only retained by extract_kwargs if the internal component has a key argument.
+        kwargs_ = extract_kwargs(a_signature, *args, _args_offset=1 if input_has_key_arg else 0, key=key, **kwargs)
 
         # Now create a resolved signature for the inner graph, then for the outer switch node.
-        resolved_signature_inner = _validate_signature(switches, **kwargs_)
-
-        input_types = {k: as_reference(v) if k != 'key' and isinstance(v, HgTimeSeriesTypeMetaData) else v for k, v in
-                       resolved_signature_inner.input_types.items()}
-        time_series_args = resolved_signature_inner.time_series_args
-        if not input_has_key_arg:
-            input_types['key'] = cast(WiringPort, key).output_type
-            time_series_args = time_series_args | {'key', }
-
-        output_type = as_reference(
-            resolved_signature_inner.output_type) if resolved_signature_inner.output_type else None
-
-        resolved_signature_outer = WiringNodeSignature(
-            node_type=resolved_signature_inner.node_type,
-            name="switch",
-            # All actual inputs are encoded in the input_types, so we just need to add the keys if present.
-            args=resolved_signature_inner.args if input_has_key_arg else ('key',) + resolved_signature_inner.args,
-            defaults=frozendict(),  # Defaults would have already been applied.
-            input_types=frozendict(input_types),
-            output_type=output_type,
-            src_location=SourceCodeDetails(Path(__file__), 25),
-            active_inputs=frozenset({'key', }),
-            valid_inputs=frozenset({'key', }),
-            # We have constructed the map so that the key are is always present.
-            unresolved_args=frozenset(),
-            time_series_args=time_series_args,
-            uses_scheduler=False,
-            label=f"switch_({{{', '.join(f'{k}: ...' for k in switches)}}}, ...)",
-        )
+        resolved_signature_inner, resolved_signature_outer = _switch_signatures(
+            switches, cast(WiringPort, key).output_type, input_has_key_arg, kwargs_)
         # Create the outer wiring node, and call it with the inputs
         from hgraph._wiring._switch_wiring_node import SwitchWiringNodeClass
+        kwargs_['key'] = key  # The outer node always takes the key
         # noinspection PyTypeChecker
         return SwitchWiringNodeClass(
             resolved_signature_outer, switches, resolved_signature_inner, reload_on_ticked
-        )(**(kwargs_ | ({} if input_has_key_arg else dict(key=key))))
+        )(**kwargs_)
+
+
+# The resolved signatures only depend on the switch components, the key type, whether the key is passed through, and the
+# types (or scalar values) of the inputs, so they are shared by all switch_ calls that wire the same components with the
+# same types. The cache is bounded, the oldest entries are evicted first.
+_SWITCH_SIGNATURES: dict[tuple, tuple[WiringNodeSignature, WiringNodeSignature]] = {}
+_MAX_SWITCH_SIGNATURES = 256
+
+
+def _switch_signatures(switches: dict[SCALAR, Callable[[...], Optional[TIME_SERIES_TYPE]]],
+                       key_tp: HgTSTypeMetaData, input_has_key_arg: bool,
+                       kwargs_: dict) -> tuple[WiringNodeSignature, WiringNodeSignature]:
+    """The resolved signatures of the inner graph and the outer switch node"""
+    # Keys that compare equal (such as 1 and True) still label the switch differently, and node classes only compare
+    # signatures and functions, so the types of both are part of the key.
+    cache_key = (tuple((type(k), k, type(v), v) for k, v in switches.items()), key_tp, input_has_key_arg,
+                 tuple((k, v.output_type) if isinstance(v, WiringPort) else (k, type(v), v)
+                       for k, v in kwargs_.items()))
+    try:
+        return _SWITCH_SIGNATURES[cache_key]
+    except TypeError:
+        # Un-hashable scalar inputs can not be cached.
+        return _build_switch_signatures(switches, key_tp, input_has_key_arg, kwargs_)
+    except KeyError:
+        signatures = _build_switch_signatures(switches, key_tp, input_has_key_arg, kwargs_)
+        if len(_SWITCH_SIGNATURES) >= _MAX_SWITCH_SIGNATURES:
+            del _SWITCH_SIGNATURES[next(iter(_SWITCH_SIGNATURES))]
+        _SWITCH_SIGNATURES[cache_key] = signatures
+        return signatures
+
+
+def _build_switch_signatures(switches: dict[SCALAR, Callable[[...], Optional[TIME_SERIES_TYPE]]],
+                             key_tp: HgTSTypeMetaData, input_has_key_arg: bool,
+                             kwargs_: dict) -> tuple[WiringNodeSignature, WiringNodeSignature]:
+    resolved_signature_inner = _validate_signature(switches, **kwargs_)
+
+    input_types = resolved_signature_inner.input_types
+    # Only re-build the inputs if there are time-series inputs (other than the key) that are not yet references.
+    if any(k != 'key' and not v.is_scalar and type(v) is not HgREFTypeMetaData for k, v in input_types.items()):
+        input_types = frozendict({k: as_reference(v) if k != 'key' and not v.is_scalar else v
+                                  for k, v in input_types.items()})
+    time_series_args = resolved_signature_inner.time_series_args
+    if not input_has_key_arg:
+        input_types = input_types | {'key': key_tp}
+        time_series_args = time_series_args | {'key', }
+
+    output_type = as_reference(
+        resolved_signature_inner.output_type) if resolved_signature_inner.output_type else None
+
+    resolved_signature_outer = WiringNodeSignature(
+        node_type=resolved_signature_inner.node_type,
+        name="switch",
+        # All actual inputs are encoded in the input_types, so we just need to add the keys if present.
+        args=resolved_signature_inner.args if input_has_key_arg else ('key',) + resolved_signature_inner.args,
+        defaults=_EMPTY_FROZENDICT,  # Defaults would have already been applied.
+        input_types=input_types,
+        output_type=output_type,
+        src_location=SourceCodeDetails(Path(__file__), 25),
+        active_inputs=frozenset({'key', }),
+        valid_inputs=frozenset({'key', }),
+        # We have constructed the map so that the key are is always present.
+        unresolved_args=frozenset(),
+        time_series_args=time_series_args,
+        uses_scheduler=False,
+        label=f"switch_({{{', '.join(f'{k}: ...' for k in switches)}}}, ...)",
+    )
+    return resolved_signature_inner, resolved_signature_outer
 
 
 def _validate_signature(switches: dict[SCALAR, Callable[[...], Optional[TIME_SERIES_TYPE]]],
                         **kwargs) -> WiringNodeSignature:
-    check_signature: WiringNodeSignature = None
-    for k, v in switches.items():
-        if check_signature is None:
-            check_signature = cast(WiringNodeClass, v).resolve_signature(**kwargs)
-        else:
-            this_signature = cast(WiringNodeClass, v).resolve_signature(**kwargs)
-            if this_signature.args != check_signature.args or \
-                    any(not check_signature.input_types[arg].matches(this_signature.input_types[arg]) for arg in
-                        check_signature.args) or \
-                    not this_signature.output_type.matches(check_signature.output_type):
-                # If the signatures do not match, then we cannot wire the switch.
-                # We ensure the arguments and their types match, as well as the output type.
-                raise CustomMessageWiringError(
-                    f"The signature of the switch nodes do not match: "
-                    f"{check_signature.signature} != {k}: {this_signature.signature}")
+    items = iter(switches.items())
+    check_signature: WiringNodeSignature = cast(WiringNodeClass, next(items)[1]).resolve_signature(**kwargs)
+    # A single component has nothing to be checked against.
+    for k, v in items:
+        this_signature = cast(WiringNodeClass, v).resolve_signature(**kwargs)
+        # Parsed meta-data is largely shared, so check identity before falling back to matches.
+        if this_signature.args != check_signature.args or \
+                any((check_tp := check_signature.input_types[arg]) is not (this_tp := this_signature.input_types[arg])
+                    and not check_tp.matches(this_tp) for arg in check_signature.args) or \
+                this_signature.output_type is not check_signature.output_type and \
+                not this_signature.output_type.matches(check_signature.output_type):
+            # If the signatures do not match, then we cannot wire the switch.
+            # We ensure the arguments and their types match, as well as the output type.
+            raise CustomMessageWiringError(
+                f"The signature of the switch nodes do not match: "
+                f"{check_signature.signature} != {k}: {this_signature.signature}")
     return check_signature
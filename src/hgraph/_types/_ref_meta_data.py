@@ -12,9 +12,11 @@ class HgREFTypeMetaData(HgTimeSeriesTypeMetaData):
     """Parses TS[...]"""
 
     value_tp: HgTimeSeriesTypeMetaData
+    is_reference = True
 
     def __init__(self, value_type: HgTimeSeriesTypeMetaData):
         self.value_tp = value_type
+        self._hash = None
 
     @property
     def is_resolved(self) -> bool:
@@ -32,7 +34,7 @@ class HgREFTypeMetaData(HgTimeSeriesTypeMetaData):
             return type(self)(self.value_tp.resolve(resolution_dict, weak))
 
     def do_build_resolution_dict(self, resolution_dict: dict[TypeVar, "HgTypeMetaData"], wired_type: "HgTypeMetaData"):
-        if isinstance(wired_type, HgREFTypeMetaData):
+        if wired_type is not None and wired_type.is_reference:
             self.value_tp.build_resolution_dict(resolution_dict, wired_type.value_tp)
         else:
             self.value_tp.build_resolution_dict(resolution_dict, wired_type if wired_type else None)
@@ -71,8 +73,10 @@ class HgREFTypeMetaData(HgTimeSeriesTypeMetaData):
         return f'HgREFTypeMetaData({repr(self.value_tp)})'
 
     def __hash__(self) -> int:
-        from hgraph._types._ref_type import REF
-        return hash(REF) ^ hash(self.value_tp)
+        if (h := self._hash) is None:
+            from hgraph._types._ref_type import REF
+            self._hash = h = hash(REF) ^ hash(self.value_tp)
+        return h
 
 
 class HgREFOutTypeMetaData(HgREFTypeMetaData):
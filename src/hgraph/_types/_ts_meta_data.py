@@ -14,6 +14,7 @@ class HgTSTypeMetaData(HgTimeSeriesTypeMetaData):
 
     def __init__(self, scalar_type: HgScalarTypeMetaData):
         self.value_scalar_tp = scalar_type
+        self._hash = None
 
     @property
     def is_resolved(self) -> bool:
@@ -68,8 +69,10 @@ class HgTSTypeMetaData(HgTimeSeriesTypeMetaData):
         return f'HgTSTypeMetaData({repr(self.value_scalar_tp)})'
 
     def __hash__(self) -> int:
-        from hgraph._types._ts_type import TS
-        return hash(TS) ^ hash(self.value_scalar_tp)
+        if (h := self._hash) is None:
+            from hgraph._types._ts_type import TS
+            self._hash = h = hash(TS) ^ hash(self.value_scalar_tp)
+        return h
 
 
 class HgTSOutTypeMetaData(HgTSTypeMetaData):
@@ -108,6 +108,7 @@ class HgTSBTypeMetaData(HgTimeSeriesTypeMetaData):
 
     def __init__(self, schema):
         self.bundle_schema_tp = schema
+        self._hash = None
 
     @property
     def is_resolved(self) -> bool:
@@ -167,8 +168,10 @@ class HgTSBTypeMetaData(HgTimeSeriesTypeMetaData):
         return f'HgTSTypeMetaData({repr(self.bundle_schema_tp)})'
 
     def __hash__(self) -> int:
-        from hgraph._types import TSB
-        return hash(TSB) ^ hash(self.bundle_schema_tp)
+        if (h := self._hash) is None:
+            from hgraph._types import TSB
+            self._hash = h = hash(TSB) ^ hash(self.bundle_schema_tp)
+        return h
 
     def __getitem__(self, item):
         return self.bundle_schema_tp[item]
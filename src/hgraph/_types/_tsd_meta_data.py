@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Type, TypeVar, Optional, _GenericAlias, Dict
 
 from hgraph._types._tsd_type import KEY_SET_ID
@@ -14,9 +15,20 @@ class HgTSDTypeMetaData(HgTimeSeriesTypeMetaData):
     key_tp: HgScalarTypeMetaData
     value_tp: HgTimeSeriesTypeMetaData
 
+    # Parsed instances are interned, this allows equality checks to short-circuit on identity.
+    _instances: dict[tuple, "HgTSDTypeMetaData"] = {}
+
     def __init__(self, key_tp: HgScalarTypeMetaData, value_tp: HgTimeSeriesTypeMetaData):
         self.value_tp = value_tp
         self.key_tp = key_tp
+        self._hash = None
+
+    @classmethod
+    def _intern(cls, key_tp: HgScalarTypeMetaData, value_tp: HgTimeSeriesTypeMetaData) -> "HgTSDTypeMetaData":
+        key = (cls, key_tp, value_tp)
+        if (instance := HgTSDTypeMetaData._instances.get(key)) is None:
+            HgTSDTypeMetaData._instances[key] = instance = cls(key_tp, value_tp)
+        return instance
 
     def matches(self, tp: "HgTypeMetaData") -> bool:
         return isinstance(tp, HgTSDTypeMetaData) and self.key_tp.matches(tp.key_tp) and self.value_tp.matches(tp.value_tp)
@@ -56,8 +68,7 @@ class HgTSDTypeMetaData(HgTimeSeriesTypeMetaData):
     def parse(cls, value) -> Optional["HgTypeMetaData"]:
         from hgraph._types._tsd_type import TimeSeriesDictInput
         if isinstance(value, _GenericAlias) and value.__origin__ is TimeSeriesDictInput:
-            return HgTSDTypeMetaData(HgScalarTypeMetaData.parse(value.__args__[0]),
-                                     HgTimeSeriesTypeMetaData.parse(value.__args__[1]))
+            return _parse_tsd(HgTSDTypeMetaData, *value.__args__)
 
     @property
     def has_references(self) -> bool:
@@ -80,7 +91,7 @@ class HgTSDTypeMetaData(HgTimeSeriesTypeMetaData):
             return self.value_tp
 
     def __eq__(self, o: object) -> bool:
-        return type(o) is HgTSDTypeMetaData and self.key_tp == o.key_tp and self.value_tp == o.value_tp
+        return self is o or (type(o) is HgTSDTypeMetaData and self.key_tp == o.key_tp and self.value_tp == o.value_tp)
 
     def __str__(self) -> str:
         return f'TSD[{str(self.key_tp)}, {str(self.value_tp)}]'
@@ -89,8 +100,10 @@ class HgTSDTypeMetaData(HgTimeSeriesTypeMetaData):
         return f'HgTSDTypeMetaData({repr(self.key_tp)}, {repr(self.value_tp)})'
 
     def __hash__(self) -> int:
-        from hgraph._types._tsd_type import TSD
-        return hash(TSD) ^ hash(self.value_tp) ^ hash(self.key_tp)
+        # The key and value types are themselves nested meta-data, so compute the hash once and keep it.
+        if (h := self._hash) is None:
+            self._hash = h = hash((type(self), self.key_tp, self.value_tp))
+        return h
 
 
 class HgTSDOutTypeMetaData(HgTSDTypeMetaData):
@@ -99,14 +112,22 @@ class HgTSDOutTypeMetaData(HgTSDTypeMetaData):
     def parse(cls, value) -> Optional["HgTypeMetaData"]:
         from hgraph._types._tsd_type import TimeSeriesDictOutput
         if isinstance(value, _GenericAlias) and value.__origin__ is TimeSeriesDictOutput:
-            return HgTSDOutTypeMetaData(HgScalarTypeMetaData.parse(value.__args__[0]),
-                                        HgTimeSeriesTypeMetaData.parse(value.__args__[1]))
+            return _parse_tsd(HgTSDOutTypeMetaData, *value.__args__)
 
     def __eq__(self, o: object) -> bool:
-        return type(o) is HgTSDOutTypeMetaData and self.key_tp == o.key_tp and self.value_tp == o.value_tp
+        return self is o or \
+            (type(o) is HgTSDOutTypeMetaData and self.key_tp == o.key_tp and self.value_tp == o.value_tp)
 
     def __str__(self) -> str:
         return f'TSD_OUT[{str(self.key_tp)}, {str(self.value_tp)}]'
 
     def __repr__(self) -> str:
         return f'HgTSDOutTypeMetaData({repr(self.key_tp)}, {repr(self.value_tp)})'
+
+    __hash__ = HgTSDTypeMetaData.__hash__  # Defining __eq__ would otherwise make the output type un-hashable
+
+
+@lru_cache(maxsize=None)
+def _parse_tsd(cls: type[HgTSDTypeMetaData], key_tp, value_tp) -> HgTSDTypeMetaData:
+    """The same TSD types are parsed repeatedly during wiring, so cache on the raw type arguments"""
+    return cls._intern(HgScalarTypeMetaData.parse(key_tp), HgTimeSeriesTypeMetaData.parse(value_tp))
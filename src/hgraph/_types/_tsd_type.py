@@ -1,4 +1,5 @@
 from abc import abstractmethod, ABC
+from functools import lru_cache, partial
 from typing import Generic, Iterable, Mapping, Union, Any, TYPE_CHECKING, Tuple
 
 from frozendict import frozendict
@@ -34,6 +35,12 @@ class TimeSeriesDict(TimeSeriesIterable[K, V], TimeSeriesDeltaValue[frozendict,
         self._ts_values: dict[str, Union[TimeSeriesInput, TimeSeriesOutput]] = {}
 
     def __class_getitem__(cls, item) -> Any:
+        # Subscripts are repeated heavily whilst wiring, so each distinct subscript is only parsed and validated once.
+        return TimeSeriesDict._class_getitem(cls, item)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _class_getitem(cls, item) -> Any:
         # For now limit to validation of item
         out = super(TimeSeriesDict, cls).__class_getitem__(item)
         if type(item) is not tuple or len(item) != 2:
@@ -53,7 +60,7 @@ class TimeSeriesDict(TimeSeriesIterable[K, V], TimeSeriesDeltaValue[frozendict,
             out.__key_tp__ = __key_tp__
             out.__value_tp__ = __value_tp__
             _init = out.__init__
-            out.__init__ = lambda *args, **kwargs: _init(out.__key_tp__, out.__value_tp__, *args, **kwargs)
+            out.__init__ = partial(_init, __key_tp__, __value_tp__)
         return out
 
     def __getitem__(self, item: K) -> V:
@@ -101,23 +108,26 @@ class TimeSeriesDict(TimeSeriesIterable[K, V], TimeSeriesDeltaValue[frozendict,
     def items(self) -> Iterable[Tuple[K, V]]:
         return self._ts_values.items()
 
+    # The modified / valid views scan the time-series values directly, this avoids a round-trip via the key set
+    # and a second dictionary lookup per key. They are materialised as lists since callers consume them fully.
+
     def modified_keys(self) -> Iterable[K]:
-        return (k for k in self.keys() if self._ts_values[k].modified)
+        return [k for k, v in self._ts_values.items() if v.modified]
 
     def modified_values(self) -> Iterable[V]:
-        return (v for v in self.values() if v.modified)
+        return [v for v in self._ts_values.values() if v.modified]
 
     def modified_items(self) -> Iterable[Tuple[K, V]]:
-        return ((k, v) for k, v in self.items() if v.modified)
+        return [(k, v) for k, v in self._ts_values.items() if v.modified]
 
     def valid_keys(self) -> Iterable[K]:
-        return (k for k in self.keys() if self._ts_values[k].valid)
+        return [k for k, v in self._ts_values.items() if v.valid]
 
     def valid_values(self) -> Iterable[V]:
-        return (v for v in self.values() if v.valid)
+        return [v for v in self._ts_values.values() if v.valid]
 
     def valid_items(self) -> Iterable[Tuple[K, V]]:
-        return ((k, v) for k, v in self.items() if v.valid)
+        return [(k, v) for k, v in self._ts_values.items() if v.valid]
 
     @abstractmethod
     def added_keys(self) -> Iterable[K]:
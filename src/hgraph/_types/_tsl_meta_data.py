@@ -20,6 +20,7 @@ class HgTSLTypeMetaData(HgTimeSeriesTypeMetaData):
     def __init__(self, value_tp: HgTimeSeriesTypeMetaData, size_tp: HgScalarTypeMetaData):
         self.value_tp = value_tp
         self.size_tp = size_tp
+        self._hash = None
 
     def matches(self, tp: "HgTypeMetaData") -> bool:
         return isinstance(tp, HgTSLTypeMetaData) and self.value_tp.matches(tp.value_tp) and self.size_tp.matches(
@@ -99,8 +100,10 @@ class HgTSLTypeMetaData(HgTimeSeriesTypeMetaData):
         return f'HgTSLTypeMetaData({repr(self.value_tp)}, {repr(self.size_tp)})'
 
     def __hash__(self) -> int:
-        from hgraph._types._ts_type import TS
-        return hash(TS) ^ hash(self.value_tp) ^ hash(self.size_tp)
+        if (h := self._hash) is None:
+            from hgraph._types._ts_type import TS
+            self._hash = h = hash(TS) ^ hash(self.value_tp) ^ hash(self.size_tp)
+        return h
 
     def __getitem__(self, item):
         return self.value_tp  # All instances of TSL are the same type
@@ -15,6 +15,7 @@ class HgTSSTypeMetaData(HgTimeSeriesTypeMetaData):
 
     def __init__(self, scalar_type: HgScalarTypeMetaData):
         self.value_scalar_tp = scalar_type
+        self._hash = None
 
     def matches(self, tp: "HgTypeMetaData") -> bool:
         return isinstance(tp, HgTSSTypeMetaData) and self.value_scalar_tp.matches(tp.value_scalar_tp)
@@ -66,8 +67,10 @@ class HgTSSTypeMetaData(HgTimeSeriesTypeMetaData):
         return f'HgTSSTypeMetaData({repr(self.value_scalar_tp)})'
 
     def __hash__(self) -> int:
-        from hgraph._types import TSS
-        return hash(TSS) ^ hash(self.value_scalar_tp)
+        if (h := self._hash) is None:
+            from hgraph._types import TSS
+            self._hash = h = hash(TSS) ^ hash(self.value_scalar_tp)
+        return h
 
 
 class HgTSSOutTypeMetaData(HgTSSTypeMetaData):
@@ -1,5 +1,5 @@
 import typing
-from collections import defaultdict
+from itertools import chain
 
 from hgraph._wiring._wiring_errors import CustomMessageWiringError
 
@@ -55,37 +55,38 @@ def create_graph_builder(sink_nodes: tuple["WiringNodeInstance"]) -> "GraphBuild
         raise RuntimeError("No sink nodes found in graph")
 
     max_rank = max(node.rank for node in sink_nodes)
-    ranked_nodes: dict[int, set[WiringNodeInstance]] = defaultdict(set)
+    ranked_nodes: list[list[WiringNodeInstance]] = [[] for _ in range(max_rank + 1)]
 
-    pending_nodes = list(sink_nodes)
+    pending_nodes = list(dict.fromkeys(sink_nodes))
+    visited: set[WiringNodeInstance] = set(pending_nodes)  # Ensure each node is only walked once
     while pending_nodes:
         node = pending_nodes.pop()
-        if (rank := node.rank) == 1:
-            # Put all push nodes at rank 0 and pull nodes at rank 1
-            rank = 0 if node.resolved_signature.node_type is NodeTypeEnum.PUSH_SOURCE_NODE else 1
-        if node.resolved_signature.node_type is NodeTypeEnum.SINK_NODE:
-            # Put all sink nodes at max_rank
-            rank = max_rank
-        ranked_nodes[rank].add(node)
-        for arg in filter(lambda k_: k_ in node.resolved_signature.time_series_inputs,
-                          node.resolved_signature.args):
-            if input_ := node.inputs.get(arg):
-                pending_nodes.append(input_.node_instance)
+        signature = node.resolved_signature
+        if not node.is_stub:
+            # Stubs are walked through for their inputs, but are never built
+            if (rank := node.rank) == 1:
+                # Put all push nodes at rank 0 and pull nodes at rank 1
+                rank = 0 if signature.node_type is NodeTypeEnum.PUSH_SOURCE_NODE else 1
+            if signature.node_type is NodeTypeEnum.SINK_NODE:
+                # Put all sink nodes at max_rank
+                rank = max_rank
+            ranked_nodes[rank].append(node)
+        time_series_args = signature.time_series_args
+        for arg in signature.args:
+            if arg in time_series_args and (input_ := node.inputs.get(arg)) and \
+                    (input_node := input_.node_instance) not in visited:
+                visited.add(input_node)
+                pending_nodes.append(input_node)
 
     # Now we can walk the tree in rank order and construct the nodes
     node_map: dict[WiringNodeInstance, int] = {}
     node_builders: [NodeBuilder] = []
-    edges: set[Edge] = set[Edge]()
-    for i in range(max_rank + 1):
-        wiring_node_set = ranked_nodes.get(i, set())
-        for wiring_node in wiring_node_set:
-            if wiring_node.is_stub:
-                continue
-            ndx = len(node_builders)
-            node_builder, input_edges = wiring_node.create_node_builder_and_edges(node_map, node_builders)
-            node_builders.append(node_builder)
-            edges.update(input_edges)
-            node_map[wiring_node] = ndx
+    edges: list[Edge] = []  # Each wiring node is only built once, so its edges are already unique
+    for wiring_node in chain.from_iterable(ranked_nodes):
+        # This records the node's index in node_map, which later ranks rely on to resolve their edges
+        node_builder, input_edges = wiring_node.create_node_builder_and_edges(node_map, node_builders)
+        node_builders.append(node_builder)
+        edges.extend(input_edges)
 
     return GraphBuilderFactory.make(node_builders=tuple[NodeBuilder, ...](node_builders),
                                     edges=tuple[Edge, ...](
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 from frozendict import frozendict
@@ -10,6 +11,10 @@ from hgraph._wiring._wiring import WiringNodeInstance, WiringPort
 from hgraph._wiring._wiring_node_signature import WiringNodeSignature, WiringNodeType
 
 
+_KEY_ARGS = frozenset(('key', 'ndx'))
+_EMPTY_FROZENDICT = frozendict()
+
+
 def create_input_stub(key: str, tp: HgTimeSeriesTypeMetaData) -> WiringPort:
     """
     Creates a stub input for a wiring node input.
@@ -18,16 +23,26 @@ def create_input_stub(key: str, tp: HgTimeSeriesTypeMetaData) -> WiringPort:
     # if the component wrapped is a graph. This would have multiple dependencies and having the stubs in once
     # place at the start of the graph is better. Using references makes this reasonably light weights with
     # minimal overhead.
-    is_key = key in ('key', 'ndx')
-    ref_tp = tp if type(tp) is HgREFTypeMetaData or is_key else HgREFTypeMetaData(tp)
-    signature = WiringNodeSignature(
+    is_key = key in _KEY_ARGS
+    ref_tp = tp if is_key or type(tp) is HgREFTypeMetaData else HgREFTypeMetaData(tp)
+    signature = _input_stub_signature(key, ref_tp)
+    # The key stub eval fn carries the key, so must be unique to the stub, the other stubs can share the node class.
+    node = PythonWiringNodeClass(signature, KeyStubEvalFn()) if is_key else _stub_node_class(signature)
+    node_instance = WiringNodeInstance(node, signature, _EMPTY_FROZENDICT, 1)
+    return WiringPort(node_instance, ())
+
+
+@lru_cache(maxsize=4096)
+def _input_stub_signature(key: str, ref_tp: HgTimeSeriesTypeMetaData) -> WiringNodeSignature:
+    """The stub signature only depends on the key and type, and the same stubs are created for each nested graph"""
+    return WiringNodeSignature(
         node_type=WiringNodeType.COMPUTE_NODE,
         name=f"stub:{key}",
         args=("ts",),
-        defaults=frozendict(),
+        defaults=_EMPTY_FROZENDICT,
         input_types=frozendict({'ts': ref_tp}),
         output_type=ref_tp,
-        src_location=SourceCodeDetails(Path(__file__), 13),
+        src_location=SourceCodeDetails(Path(__file__), create_input_stub.__code__.co_firstlineno),
         active_inputs=frozenset(),
         valid_inputs=frozenset(),
         unresolved_args=frozenset(),
@@ -35,9 +50,6 @@ def create_input_stub(key: str, tp: HgTimeSeriesTypeMetaData) -> WiringPort:
         uses_scheduler=False,
         label=key
     )
-    node = PythonWiringNodeClass(signature, KeyStubEvalFn() if is_key else _stub)
-    node_instance = WiringNodeInstance(node, signature, frozendict(), 1)
-    return WiringPort(node_instance, ())
 
 
 def create_output_stub(output: WiringPort):
@@ -47,14 +59,22 @@ def create_output_stub(output: WiringPort):
     # This ensures symetry.
     tp = output.output_type
     ref_tp = tp if type(tp) is HgREFTypeMetaData else HgREFTypeMetaData(tp)
-    signature = WiringNodeSignature(
+    signature = _output_stub_signature(ref_tp)
+    node = _stub_node_class(signature)
+    node_instance = WiringNodeInstance(node, signature, frozendict({"ts": output}), output.rank + 1)
+    WiringGraphContext.instance().add_sink_node(node_instance)  # We cheat a bit since this is not actually a sink_node.
+
+
+@lru_cache(maxsize=4096)
+def _output_stub_signature(ref_tp: HgTimeSeriesTypeMetaData) -> WiringNodeSignature:
+    return WiringNodeSignature(
         node_type=WiringNodeType.COMPUTE_NODE,
         name=f"stub:__out__",
         args=('ts',),
-        defaults=frozendict(),
+        defaults=_EMPTY_FROZENDICT,
         input_types=frozendict({'ts': ref_tp}),
         output_type=ref_tp,
-        src_location=SourceCodeDetails(Path(__file__), 42),
+        src_location=SourceCodeDetails(Path(__file__), create_output_stub.__code__.co_firstlineno),
         active_inputs=frozenset(),
         valid_inputs=frozenset(),
         unresolved_args=frozenset(),
@@ -62,9 +82,11 @@ def create_output_stub(output: WiringPort):
         uses_scheduler=False,
         label="graph:out"
     )
-    node = PythonWiringNodeClass(signature, _stub)
-    node_instance = WiringNodeInstance(node, signature, frozendict({"ts": output}), output.rank + 1)
-    WiringGraphContext.instance().add_sink_node(node_instance)  # We cheat a bit since this is not actually a sink_node.
+
+
+@lru_cache(maxsize=4096)
+def _stub_node_class(signature: WiringNodeSignature) -> PythonWiringNodeClass:
+    return PythonWiringNodeClass(signature, _stub)
 
 
 # Provide a light-weight function to use standard python compute node implementation choice.
@@ -85,6 +107,8 @@ class KeyStubEvalFn:
     """
     A callable object we can attach the key to, then during start it will inject the key into the output.
     """
+    __slots__ = ("key",)
+
     def __init__(self):
         self.key = None
 
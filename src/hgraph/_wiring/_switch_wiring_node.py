@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Mapping, Any, TYPE_CHECKING
 
 from frozendict import frozendict
@@ -11,6 +12,7 @@ from hgraph._wiring._wiring_utils import wire_nested_graph, extract_stub_node_in
 if TYPE_CHECKING:
     from hgraph._runtime._node import NodeSignature
     from hgraph._builder._node_builder import NodeBuilder
+    from hgraph._builder._graph_builder import GraphBuilder
 
 __all__ = ("SwitchWiringNodeClass",)
 
@@ -30,16 +32,41 @@ class SwitchWiringNodeClass(BaseWiringNodeClass):
     def create_node_builder_instance(self, node_signature: "NodeSignature",
                                      scalars: Mapping[str, Any]) -> "NodeBuilder":
         # create nested graphs
-        nested_graphs = {k: wire_nested_graph(v, self._resolved_signature_inner.input_types, scalars, self.signature) for k, v in
-                         self._nested_graphs.items()}
+        scalars = frozendict(scalars)
+        nested_graphs = {}
         nested_graph_input_ids = {}
         nested_graph_output_ids = {}
-        for k, v in nested_graphs.items():
-            nested_graph_input_ids[k], nested_graph_output_ids[k] = \
-                extract_stub_node_indices(v, self._resolved_signature_inner.time_series_args)
+        for k, v in self._nested_graphs.items():
+            nested_graphs[k], nested_graph_input_ids[k], nested_graph_output_ids[k] = \
+                _wire_switch_graph(v, self._resolved_signature_inner, scalars, self.signature)
 
         input_builder, output_builder = create_input_output_builders(node_signature)
 
         return PythonSwitchNodeBuilder(node_signature, scalars, input_builder, output_builder,
                                        frozendict(nested_graphs), frozendict(nested_graph_input_ids),
                                        frozendict(nested_graph_output_ids), self._reload_on_ticked)
+
+
+def _wire_switch_graph(fn: WiringNodeClass, resolved_signature_inner: WiringNodeSignature,
+                       scalars: frozendict[str, Any], outer_signature: WiringNodeSignature) \
+        -> tuple["GraphBuilder", frozendict[str, int], int]:
+    """
+    Wire a nested switch graph, the result is only dependent on the inputs, so re-use previously built graphs
+    where the scalars allow this.
+    """
+    try:
+        hash(scalars)
+    except TypeError:  # Un-hashable scalars, so just wire the graph
+        return _do_wire_switch_graph(fn, resolved_signature_inner, scalars, outer_signature)
+    return _wire_switch_graph_cached(fn, resolved_signature_inner, scalars, outer_signature)
+
+
+def _do_wire_switch_graph(fn: WiringNodeClass, resolved_signature_inner: WiringNodeSignature,
+                          scalars: frozendict[str, Any], outer_signature: WiringNodeSignature) \
+        -> tuple["GraphBuilder", frozendict[str, int], int]:
+    nested_graph = wire_nested_graph(fn, resolved_signature_inner.input_types, scalars, outer_signature)
+    return nested_graph, *extract_stub_node_indices(nested_graph, resolved_signature_inner.time_series_args)
+
+
+# Bounded, since each entry keeps the nested graph builder (and its wiring) alive.
+_wire_switch_graph_cached = lru_cache(maxsize=128)(_do_wire_switch_graph)
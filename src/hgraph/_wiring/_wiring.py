@@ -658,16 +658,18 @@ class WiringNodeInstance:
         node_index = len(nodes)
         node_map[self] = node_index  # Update this wiring nodes index in the graph
 
-        scalars = frozendict({k: t.injector if t.is_injectable else self.inputs[k] for k, t in
-                              self.resolved_signature.scalar_inputs.items()})
+        signature = self.resolved_signature
+        inputs = self.inputs
+        scalars = frozendict({k: t.injector if t.is_injectable else inputs[k] for k, t in
+                              signature.scalar_inputs.items()})
 
         node_builder = self.node.create_node_builder_instance(self.node_signature, scalars)
         # Extract out edges
 
         edges = set()
-        for ndx, arg in enumerate(raw_arg for raw_arg in self.resolved_signature.args if
-                                  raw_arg in self.resolved_signature.time_series_args):
-            input_: WiringPort = self.inputs.get(arg)
+        time_series_args = signature.time_series_args
+        for ndx, arg in enumerate(raw_arg for raw_arg in signature.args if raw_arg in time_series_args):
+            input_: WiringPort = inputs.get(arg)
             if input_ is not None:
                 edges.update(input_.edges_for(node_map, node_index, (ndx,)))
 
@@ -49,7 +49,7 @@ def extract_scalar_type(tp: Type) -> HgScalarTypeMetaData:
     return tp_
 
 
-@dataclass(frozen=True, unsafe_hash=True)
+@dataclass(frozen=True)
 class WiringNodeSignature:
     """
     The wiring node signature is similar to the final node signature, but it deals with templated node instances,
@@ -72,6 +72,16 @@ class WiringNodeSignature:
     # supplied via inputs
     label: str | None = None  # A label if provided, this can help to disambiguate the node
 
+    def __hash__(self) -> int:
+        # Signatures are used as keys throughout wiring and the field-wise hash recurses into the type meta-data,
+        # so compute it once and stash it on the (frozen) instance.
+        if (h := self.__dict__.get("_hash")) is None:
+            h = hash((self.node_type, self.name, self.args, self.defaults, self.input_types, self.output_type,
+                      self.src_location, self.active_inputs, self.valid_inputs, self.unresolved_args,
+                      self.time_series_args, self.uses_scheduler, self.label))
+            object.__setattr__(self, "_hash", h)
+        return h
+
     @property
     def signature(self) -> str:
         args = (f'{arg}: {str(self.input_types[arg])}'
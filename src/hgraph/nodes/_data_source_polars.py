@@ -7,7 +7,7 @@ import polars as pl
 
 from hgraph import TS_SCHEMA, TSB, TIME_SERIES_TYPE, SCALAR, TSD, HgScalarTypeMetaData, UnNamedTimeSeriesSchema, \
     generator, HgTSTypeMetaData, graph, sink_node, GlobalState, CustomMessageWiringError, AUTO_RESOLVE
-from hgraph.nodes._record import record, get_recorded_value
+from hgraph.nodes._record import record, get_recorded_columns
 
 
 __all__ = ("from_polars", "to_polars", "get_polars_df")
@@ -31,34 +31,39 @@ def from_polars(df: pl.DataFrame, time_col: str, as_bundle: bool = True, include
             raise CustomMessageWiringError("All columns must have the same type when creating a TSD output type")
         output_type = TSD[str, tp_]
 
+    value_names = tuple(k for k in df.columns if include_time or k != time_col)
+
     @generator
     def _from_polars() -> output_type:
-        for row in df.iter_rows(named=True):
-            if include_time:
-                yield row[time_col], row
-            else:
-                yield row.pop(time_col), row
+        # Extract the columns in one go and then index the rows out, rather than have polars construct each row.
+        # Drive the rows off the time column, so a frame with no value columns still ticks once per time.
+        columns = df.to_dict(as_series=False)
+        value_columns = tuple((k, columns[k]) for k in value_names)
+        for ndx, t in enumerate(columns[time_col]):
+            yield t, {k: c[ndx] for k, c in value_columns}
 
     return _from_polars()
 
 
+_POLARS_TO_HGRAPH_TYPES: dict[pl.datatypes.PolarsDataType, HgScalarTypeMetaData] = {
+    pl.datatypes.Int8: HgScalarTypeMetaData.parse(int),
+    pl.datatypes.Int16: HgScalarTypeMetaData.parse(int),
+    pl.datatypes.Int32: HgScalarTypeMetaData.parse(int),
+    pl.datatypes.Int64: HgScalarTypeMetaData.parse(int),
+    pl.datatypes.Float32: HgScalarTypeMetaData.parse(float),
+    pl.datatypes.Float64: HgScalarTypeMetaData.parse(float),
+    pl.datatypes.Utf8: HgScalarTypeMetaData.parse(str),
+    pl.datatypes.Date: HgScalarTypeMetaData.parse(date),
+    pl.datatypes.Datetime: HgScalarTypeMetaData.parse(datetime),
+    pl.datatypes.Time: HgScalarTypeMetaData.parse(time),
+    pl.datatypes.Duration: HgScalarTypeMetaData.parse(timedelta),
+    pl.datatypes.Boolean: HgScalarTypeMetaData.parse(bool),
+    # pl.datatypes.Categorical: HgScalarTypeMetaData.parse(str),
+}
+
+
 def _polars_type_to_hgraph_type(tp: pl.datatypes.PolarsDataType) -> HgScalarTypeMetaData:
-    types: dict[pl.datatypes.PolarsDataType, HgScalarTypeMetaData] = {
-        pl.datatypes.Int8: HgScalarTypeMetaData.parse(int),
-        pl.datatypes.Int16: HgScalarTypeMetaData.parse(int),
-        pl.datatypes.Int32: HgScalarTypeMetaData.parse(int),
-        pl.datatypes.Int64: HgScalarTypeMetaData.parse(int),
-        pl.datatypes.Float32: HgScalarTypeMetaData.parse(float),
-        pl.datatypes.Float64: HgScalarTypeMetaData.parse(float),
-        pl.datatypes.Utf8: HgScalarTypeMetaData.parse(str),
-        pl.datatypes.Date: HgScalarTypeMetaData.parse(date),
-        pl.datatypes.Datetime: HgScalarTypeMetaData.parse(datetime),
-        pl.datatypes.Time: HgScalarTypeMetaData.parse(time),
-        pl.datatypes.Duration: HgScalarTypeMetaData.parse(timedelta),
-        pl.datatypes.Boolean: HgScalarTypeMetaData.parse(bool),
-        # pl.datatypes.Categorical: HgScalarTypeMetaData.parse(str),
-    }
-    return types[tp]
+    return _POLARS_TO_HGRAPH_TYPES[tp]
 
 
 @graph
@@ -85,10 +90,20 @@ def to_polars(ts: TSB[TS_SCHEMA], time_col: str = "time", location: str = "polar
 
     @_stub.stop
     def _stub_stop(location: str, schema: type[TS_SCHEMA]):
-        df_s = [pl.DataFrame(get_recorded_value(label=f"{location}::{k}"), schema=[time_col, k]) for k in schema.keys()]
-        df = df_s[0]
-        for df_other in df_s[1:]:
-            df = df.join(df_other, on=time_col, how="outer")
+        # Align the recorded columns on the merged time axis and construct the data frame in one go, rather than
+        # joining a data frame per column.
+        recorded = {k: get_recorded_columns(label=f"{location}::{k}") for k in schema.keys()}
+        times = sorted(set().union(*(times_ for times_, _ in recorded.values())))
+        time_ndx = {t: ndx for ndx, t in enumerate(times)}
+        columns = {time_col: times}
+        for k, (times_, values) in recorded.items():
+            if times_ == times:
+                columns[k] = values
+            else:
+                columns[k] = column = [None] * len(times)
+                for t, v in zip(times_, values):
+                    column[time_ndx[t]] = v
+        df = pl.DataFrame(columns)
         GlobalState.instance()[f"nodes.{to_polars.signature.name}.{location}"] = df
 
     _stub(ts, location, schema)
@@ -10,21 +10,35 @@ def record(ts: TIME_SERIES_TYPE, label: str = "out", record_delta_values: bool =
     """
     This node will record the values of the time series into the provided list.
     """
-    state.record_value.append((context.evaluation_time,
-                               ts.delta_value if record_delta_values else ts.value))
+    state.record_times.append(context.evaluation_time)
+    state.record_values.append(ts.delta_value if record_delta_values else ts.value)
+
+
+_RECORDED_KEY_PREFIX = f"nodes.{record.signature.name}."
 
 
 @record.start
 def record_start(label: str, state: STATE):
-    value = []
+    # The times and values are recorded as parallel columns, saving a tuple per tick, the (time, value) pairs are
+    # only materialised when requested.
+    times = []
+    values = []
     global_state = GlobalState.instance()
-    global_state[f"nodes.{record.signature.name}.{label}"] = value
-    state.record_value = value
+    global_state[_RECORDED_KEY_PREFIX + label] = times, values
+    state.record_times = times
+    state.record_values = values
 
 
 def get_recorded_value(label: str = "out") -> list[tuple[datetime, Any]]:
     """
     Returns the recorded values for the given label.
     """
+    return list(zip(*get_recorded_columns(label)))
+
+
+def get_recorded_columns(label: str = "out") -> tuple[list[datetime], list[Any]]:
+    """
+    Returns the recorded times and values for the given label as two parallel lists.
+    """
     global_state = GlobalState.instance()
-    return global_state[f"nodes.{record.signature.name}.{label}"]
+    return global_state[_RECORDED_KEY_PREFIX + label]
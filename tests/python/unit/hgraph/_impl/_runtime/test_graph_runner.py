@@ -1,7 +1,8 @@
-from hgraph import graph, run_graph, compute_node, TS, TIME_SERIES_TYPE
-from hgraph._runtime._evaluation_engine import EvaluationMode
+from hgraph import graph, run_graph, compute_node, TS, TIME_SERIES_TYPE, SCHEDULER, MIN_TD
+from hgraph._runtime._evaluation_engine import EvaluationMode, EvaluationEngineApi, EvaluationLifeCycleObserver
 from hgraph.nodes import const, write_str
 from hgraph.nodes._print import debug_print
+from hgraph.test import eval_node
 
 
 def test_hello_world():
@@ -26,4 +27,57 @@ def test_compute_node():
         t = tick(c)
         debug_print("t", t)
 
-    run_graph(hello_world, run_mode=EvaluationMode.SIMULATION)
\ No newline at end of file
+    run_graph(hello_world, run_mode=EvaluationMode.SIMULATION)
+
+
+def test_scheduled_node():
+
+    @compute_node
+    def delayed(ts: TS[int], sched: SCHEDULER = None) -> TS[int]:
+        if ts.modified:
+            sched.schedule(MIN_TD * 3)
+        if sched.is_scheduled_now:
+            return ts.value * 10
+
+    assert eval_node(delayed, [1, None, None, None, 2]) == [None, None, None, 10, None, None, None, 20]
+
+
+def test_scheduled_node_tag():
+
+    @compute_node
+    def debounce(ts: TS[int], sched: SCHEDULER = None) -> TS[int]:
+        if ts.modified:
+            sched.schedule(MIN_TD * 2, tag="debounce")
+        if sched.is_scheduled_now:
+            return ts.value * 10
+
+    assert eval_node(debounce, [1, 2, None, None, 5]) == [None, None, None, 20, None, None, 50]
+
+
+def test_life_cycle_observer():
+
+    class _Observer(EvaluationLifeCycleObserver):
+
+        def __init__(self):
+            self.evaluated = []
+            self.stopped = []
+
+        def on_after_node_evaluation(self, node):
+            self.evaluated.append(node.signature.name)
+
+        def on_after_stop_node(self, node):
+            self.stopped.append(node.signature.name)
+
+    observer = _Observer()
+
+    @compute_node
+    def observed(ts: TS[int], api: EvaluationEngineApi = None) -> TS[int]:
+        return ts.value
+
+    @observed.start
+    def observed_start(api: EvaluationEngineApi):
+        api.add_life_cycle_observer(observer)
+
+    assert eval_node(observed, [1, None, 2]) == [1, None, 2]
+    assert observer.evaluated.count("observed") == 2
+    assert "observed" in observer.stopped
@@ -148,3 +148,14 @@ def test_size():
     assert sz is sz2
 
     assert sz.__name__ == 'Size_20'
+
+
+def test_tsd_meta_data_interned():
+    tsd = HgTypeMetaData.parse(TSD[str, TS[int]])
+    assert tsd is HgTypeMetaData.parse(TSD[str, TS[int]])
+    assert hash(tsd) == hash(HgTSDTypeMetaData(tsd.key_tp, tsd.value_tp))
+
+    tsd_out = HgTypeMetaData.parse(TSD_OUT[str, TS[int]])
+    assert tsd_out is HgTypeMetaData.parse(TSD_OUT[str, TS[int]])
+    assert tsd_out != tsd
+    assert len({tsd, tsd_out}) == 2
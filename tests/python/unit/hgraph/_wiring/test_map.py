@@ -1,7 +1,9 @@
 import pytest
 from frozendict import frozendict
 
-from hgraph import graph, TS, TSD, TSS, TSL, SIZE, map_, reduce, HgTypeMetaData, SCALAR, Size, REF
+from hgraph import graph, TS, TSD, TSS, TSL, SIZE, map_, reduce, HgTypeMetaData, SCALAR, Size, REF, compute_node, \
+    SCHEDULER, MIN_TD, REMOVE
+from hgraph._impl._types._tss import Removed
 from hgraph._runtime._map import _build_map_wiring_node_and_inputs
 from hgraph._wiring._map_wiring_node import TsdMapWiringSignature, TslMapWiringSignature
 from hgraph.nodes import add_, debug_print, const
@@ -181,6 +183,38 @@ def test_tsd_map_wiring_no_kwargs():
     _test_tsd_map(map_test)
 
 
+def test_tsd_map_rebuilds_removed_key():
+    events = []
+
+    @compute_node
+    def scaled(ts: TS[int], sched: SCHEDULER = None) -> TS[int]:
+        if ts.modified:
+            sched.schedule(MIN_TD)
+        return ts.value * 10
+
+    @scaled.start
+    def scaled_start():
+        events.append("start")
+
+    @scaled.stop
+    def scaled_stop():
+        events.append("stop")
+
+    @graph
+    def scaled_graph(ts: TS[int]) -> TS[int]:
+        return scaled(ts)
+
+    @graph
+    def map_test(keys: TSS[str], ts: TSD[str, TS[int]]) -> TSD[str, TS[int]]:
+        return map_(scaled_graph, ts, keys=keys)
+
+    # The nested graph for 'a' is disposed of when the key is removed and built again when it is re-added.
+    out = eval_node(map_test, [{'a'}, {Removed('a')}, {'a'}], [{'a': 1}, {'a': REMOVE}, {'a': 3}])
+    assert out[0] == {'a': 10}
+    assert out[2] == {'a': 30}
+    assert events == ["start", "stop", "start"]
+
+
 def _test_tsd_map(map_test):
     out = eval_node(map_test, [{'a', 'b'}, ], [{'a': 1}, {'b': 2}], [{'a': 2}, {'b': 3}])
     assert out == [{'a': 3}, {'b': 5}]
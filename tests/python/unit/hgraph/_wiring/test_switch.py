@@ -1,6 +1,6 @@
 import pytest
 
-from hgraph import switch_, graph, TS
+from hgraph import switch_, graph, TS, compute_node
 from hgraph.nodes import add_, sub_
 from hgraph.test import eval_node
 
@@ -13,3 +13,31 @@ def test_switch():
         return s
 
     eval_node(switch_test, ['add', 'sub'], [1, 2], [3, 4]) == [4, -2]
+
+
+def test_switch_wired_twice():
+
+    @graph
+    def switch_test(key: TS[str], lhs: TS[int], rhs: TS[int]) -> TS[int]:
+        s1 = switch_({'add': add_, 'sub': sub_}, key, lhs, rhs)
+        s2 = switch_({'add': add_, 'sub': sub_}, key, lhs, rhs)
+        return add_(s1, s2)
+
+    assert eval_node(switch_test, ['add', 'sub'], [1, 2], [3, 4]) == [8, -4]
+
+
+def test_switch_with_key_arg():
+
+    @compute_node
+    def join_(key: TS[str], v: TS[int]) -> TS[str]:
+        return f"{key.value}{v.value}"
+
+    @compute_node
+    def join_dash(key: TS[str], v: TS[int]) -> TS[str]:
+        return f"{key.value}-{v.value}"
+
+    @graph
+    def switch_test(key: TS[str], v: TS[int]) -> TS[str]:
+        return switch_({'a': join_, 'b': join_dash}, key, v)
+
+    assert eval_node(switch_test, ['a', 'b'], [1, 2]) == ['a1', 'b-2']
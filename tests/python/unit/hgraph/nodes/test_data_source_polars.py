@@ -1,7 +1,8 @@
 try:
     import polars as pl
 
-    from hgraph import MIN_ST, MIN_TD, graph, TSB, TS, ts_schema, TSD, TS_SCHEMA, GlobalState
+    from hgraph import MIN_ST, MIN_TD, graph, TSB, TS, ts_schema, TSD, TS_SCHEMA, GlobalState, sink_node, \
+        EvaluationEngineApi, EvaluationLifeCycleObserver
     from hgraph.test import eval_node
     from hgraph.nodes import from_polars, debug_print, to_polars, get_polars_df
 
@@ -32,6 +33,34 @@ try:
         assert eval_node(polars_graph) == [{'a': 1.0, 'b': 4.0}, {'a': 2.0, 'b': 5.0}, {'a': 3.0, 'b': 6.0}]
 
 
+    def test_from_polars_time_only():
+
+        class _Observer(EvaluationLifeCycleObserver):
+            def __init__(self):
+                self.evaluated = []
+
+            def on_after_node_evaluation(self, node):
+                self.evaluated.append(node.signature.name)
+
+        observer = _Observer()
+
+        @sink_node
+        def observe(ts: TSB[TS_SCHEMA], api: EvaluationEngineApi = None):
+            pass
+
+        @observe.start
+        def observe_start(api: EvaluationEngineApi):
+            api.add_life_cycle_observer(observer)
+
+        @graph
+        def polars_graph():
+            df = pl.DataFrame({"time": [MIN_ST, MIN_ST + MIN_TD, MIN_ST + MIN_TD * 2]})
+            observe(from_polars(df, "time"))
+
+        eval_node(polars_graph)
+        assert observer.evaluated.count("_from_polars") == 3
+
+
     def test_to_polars():
 
         @graph
@@ -33,4 +33,21 @@ def test_push_queue():
     run_graph(main, run_mode=EvaluationMode.REAL_TIME, start_time=now, end_time=now + timedelta(seconds=3))
     values = get_recorded_value()
     # The exact timings are not that important.
-    assert [v[1] for v in values] == ["1", "2", "3"]
\ No newline at end of file
+    assert [v[1] for v in values] == ["1", "2", "3"]
+
+
+def test_push_queue_in_simulation():
+
+    @push_queue(TS[str])
+    def my_message_sender(sender: Callable[[str], None]):
+        pass
+
+    @graph
+    def main():
+        record(my_message_sender(), label="messages")
+        record(const("1"))
+
+    GlobalState.reset()
+    run_graph(main, run_mode=EvaluationMode.SIMULATION)
+    assert [v[1] for v in get_recorded_value()] == ["1"]
+    assert get_recorded_value("messages") == []
@@ -0,0 +1,16 @@
+from hgraph import TSS, graph
+from hgraph._impl._types._tss import Removed
+from hgraph.nodes import union_
+from hgraph.test import eval_node
+
+
+def test_union():
+
+    @graph
+    def union_test(lhs: TSS[int], rhs: TSS[int]) -> TSS[int]:
+        return union_(lhs, rhs)
+
+    assert eval_node(union_test,
+                     [{1, 2}, {Removed(1)}, None, {Removed(2)}],
+                     [{2, 3}, None, {Removed(2)}, None]
+                     ) == [{1, 2, 3}, {Removed(1)}, None, {Removed(2)}]